@@ -1,199 +1,34 @@
-import gymnasium as gym
-import torch
-import torch.nn as nn
-from models import DQN
+import argparse
 import numpy as np
-import line_follower_v0, os
-from tqdm import tqdm, trange
+import os
 import matplotlib.pyplot as plt
 
-def evaluate_model(
-    model, env_name, render_mode,
-    sensor_grid,
-    track,
-    max_steps,
-    hitbox,
-    x_spacing,
-    y_spacing,
-    episodes,
-    verbose=False,
-    invert_waypoints=None,
-    invert_colours=None
-):
-    total_rewards = []
-    for ep in range(episodes):
-        env = gym.make(
-            f'my_gym_envs/{env_name}', render_mode=render_mode,
-            sensor_grid=sensor_grid,
-            track=track,
-            max_steps=max_steps,
-            hitbox=hitbox,
-            x_spacing=x_spacing,
-            y_spacing=y_spacing,
-            verbose=verbose,
-            invert_waypoints=invert_waypoints,
-            invert_colours=invert_colours
-        )
-        # env.metadata["render_fps"] = 5
-    
-        state, _ = env.reset()
-        done = False
-        total_reward = 0
-
-        while not done:
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                q_values = model(state_tensor)
-                action = q_values.argmax().item()
-
-            next_state, reward, terminated, truncated, _ = env.step(action)
-            state = next_state
-            total_reward += reward
-            done = terminated or truncated
-
-        total_rewards.append(total_reward)
-        if verbose: print(f"Episode {ep+1}: Total Reward = {total_reward}")
-
-    env.close()
-    return np.mean(total_rewards)
-
-
-
-models = []
-episodes = []
-for a in os.listdir("for_video/saved_models"):
-    if a.endswith(".pth"):
-        models.append(a)
-        episodes.append(int(a[:-4]))
-models.sort(key=lambda x: int(x[:-4]))
-episodes.sort()
-
-# invert_waypoints, invert_colours
-perf_00 = []
-perf_01 = []
-perf_10 = []
-perf_11 = []
-
-for i, model_path in enumerate(tqdm(models)):
-    loaded_model = torch.load(os.path.join("for_video/saved_models", model_path), map_location=torch.device('cpu'), weights_only=False)
-    sensor_grid = loaded_model["sensor_grid"]
-    hitbox = loaded_model["hitbox"]
-
-    max_steps = loaded_model["max_steps"]
-    # max_steps = 500
-    track = loaded_model["track"]
-    # track = "rounded_square"
-
-    policy_net = DQN(
-        sensor_grid[0]*sensor_grid[1],
-        loaded_model["action_dim"],
-        loaded_model["hidden_dim"],
-        loaded_model["hidden_layers"]
-    )
-    policy_net.load_state_dict(loaded_model["state_dict"])
-    policy_net.eval()
-
-
-    # 00
-    perf_00.append(evaluate_model(
-        policy_net,
-        "line_follower_v0",
-        None,
-        sensor_grid,
-        track,
-        max_steps,
-        hitbox,
-        x_spacing=loaded_model["x_spacing"],
-        y_spacing=loaded_model["y_spacing"],
-        episodes=100,
-        verbose=False,
-        invert_waypoints=False,
-        invert_colours=False
-    ))
-
-    # 01
-    perf_01.append(evaluate_model(
-        policy_net,
-        "line_follower_v0",
-        None,
-        sensor_grid,
-        track,
-        max_steps,
-        hitbox,
-        x_spacing=loaded_model["x_spacing"],
-        y_spacing=loaded_model["y_spacing"],
-        episodes=100,
-        verbose=False,
-        invert_waypoints=False,
-        invert_colours=True
-    ))
-
-    # 10
-    perf_10.append(evaluate_model(
-        policy_net,
-        "line_follower_v0",
-        None,
-        sensor_grid,
-        track,
-        max_steps,
-        hitbox,
-        x_spacing=loaded_model["x_spacing"],
-        y_spacing=loaded_model["y_spacing"],
-        episodes=100,
-        verbose=False,
-        invert_waypoints=True,
-        invert_colours=False
-    ))
-
-    # 11
-    perf_11.append(evaluate_model(
-        policy_net,
-        "line_follower_v0",
-        None,
-        sensor_grid,
-        track,
-        max_steps,
-        hitbox,
-        x_spacing=loaded_model["x_spacing"],
-        y_spacing=loaded_model["y_spacing"],
-        episodes=100,
-        verbose=False,
-        invert_waypoints=True,
-        invert_colours=True
-    ))
-    
-    # print(episodes[:i+1], perf_00)
-
-
-    # plt.figure(figsize=(10,6))
-    # plt.plot(episodes[:i+1], perf_00, label="white  cw")
-    # plt.plot(episodes[:i+1], perf_01, label="black  cw")
-    # plt.plot(episodes[:i+1], perf_10, label="white ccw")
-    # plt.plot(episodes[:i+1], perf_11, label="black ccw")
-    # plt.plot(episodes[:i+1], np.mean([perf_00, perf_01, perf_10, perf_11], axis=0), label="Average", linestyle='--', color='black')
-    # # plt.xticks(np.arange(50, episodes[i+1]+1, 50))
-    # plt.xticks(np.arange(50, 800, 20))
-    # # rotate the x labels
-    # plt.xticks(rotation=90)
-    # plt.xlabel("Training Episodes")
-    # plt.ylabel("Average Reward")
-    # plt.title("Model Performance under Different Inversion Settings")
-    # plt.legend()
-    # plt.grid()
-    # plt.savefig("for_video/analyse.png")
-    # plt.close()
-    
-    
-    
-    
-    
-    
+from eval_matrix import CONDITIONS, EvalCache, evaluate_matrix
+
+MODELS_DIR = "for_video/saved_models"
+RESULTS_PATH = "for_video/analyse100.npy"
+PLOT_PATH = "for_video/analyse100.png"
+CACHE_DIR = "for_video/eval_cache"  # results per (checkpoint content, env config, episodes, seed)
+EPISODES = 100     # per cell, or the maximum with a tolerance
+TOLERANCE = 5.0    # stop a cell once its 95% CI half-width on the mean reward is this small
+BATCH_EPISODES = 20
+WORKERS = os.cpu_count()
+
+# (label, colour, (invert_waypoints, invert_colours)) per panel, top to bottom
+PANELS = [
+    ("black cw", "tab:blue", (False, True)),
+    ("black ccw", "tab:orange", (True, True)),
+    ("white cw", "tab:green", (False, False)),
+    ("white ccw", "tab:red", (True, False)),
+]
+
+def plot_matrix(results, path):
     fig, axs = plt.subplots(4, 1, figsize=(15, 10), sharex=True)
 
-    axs[0].plot(episodes[:i+1], perf_01, label="black cw", color="tab:blue")
-    axs[1].plot(episodes[:i+1], perf_11, label="black ccw", color="tab:orange")
-    axs[2].plot(episodes[:i+1], perf_00, label="white cw", color="tab:green")
-    axs[3].plot(episodes[:i+1], perf_10, label="white ccw", color="tab:red")
+    for ax, (label, color, (invert_waypoints, invert_colours)) in zip(axs, PANELS):
+        rows = results[(results["invert_waypoints"] == invert_waypoints) & (results["invert_colours"] == invert_colours)]
+        rows = np.sort(rows, order="episode")
+        ax.plot(rows["episode"] + 1, rows["mean_reward"], label=label, color=color)
 
     for ax in axs:
         ax.set_ylabel("Avg Reward")
@@ -205,9 +40,31 @@ for i, model_path in enumerate(tqdm(models)):
 
     fig.suptitle("Model Performance under Different Inversion Settings")
     plt.tight_layout(rect=[0, 0, 1, 0.96])
-    plt.savefig("for_video/analyse100.png")
+    plt.savefig(path)
     plt.close()
 
-
-
-
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate every saved model under all inversion settings.")
+    parser.add_argument("--no_cache", action="store_true", help="Re-evaluate everything instead of reusing cached results.")
+    parser.add_argument("--prune", action="store_true", help="Delete cached results not used by this run.")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="CI half-width at which a cell stops early (0 = always run EPISODES).")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else EvalCache(CACHE_DIR)
+    models = [a for a in os.listdir(MODELS_DIR) if a.endswith(".pth")]
+    models.sort(key=lambda x: int(x[:-4]))
+
+    results = evaluate_matrix(
+        [os.path.join(MODELS_DIR, m) for m in models],
+        CONDITIONS,
+        episodes=EPISODES,
+        max_workers=WORKERS,
+        cache=cache,
+        tolerance=args.tolerance or None,
+        batch_episodes=BATCH_EPISODES
+    )
+    print(f"{results['episodes_used'].sum()} episodes for {len(results)} cells (at most {EPISODES * len(results)}).")
+    if cache is not None and args.prune:
+        print(f"Removed {cache.prune()} stale cache entries.")
+    np.save(RESULTS_PATH, results)
+    plot_matrix(results, PLOT_PATH)
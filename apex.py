@@ -0,0 +1,256 @@
+import gymnasium as gym
+import numpy as np
+import torch
+import torch.optim as optim
+import torch.multiprocessing as mp
+import dataclasses, json, os, random, queue
+from dataclasses import dataclass
+from functools import partial
+from tqdm import tqdm
+
+from evaluate import evaluate_model
+from models import DQN
+from replay_buffer import ReplayBuffer
+from checkpoint import CheckpointWriter, policy_artifact
+from dqn_update import DQNUpdater
+from train import TrainConfig, make_env, make_env_kwargs, parse_config, set_threads
+
+# Ape-X style training: actor processes collect experience with their own
+# environment and a periodically refreshed copy of the weights, the learner
+# process owns the replay memory, policy_net, target_net and the optimizer.
+# Settings are a TrainConfig plus the actor fields below, and the run's files
+# go into run_dir like train.py's:
+#   python apex.py --run_dir runs/apex --num_actors 8 --threads 2
+
+@dataclass
+class ApexConfig(TrainConfig):
+    # Fields of the single-process loop (epsilon schedule, num_envs, prioritized
+    # replay, train_every, grad_steps, ...) are not used here: actors explore
+    # with fixed per-actor epsilons and the learner takes one step per drain.
+    num_actors: int = 4
+    actor_eps: float = 0.4     # actor i explores with actor_eps ** (1 + actor_alpha * i / (num_actors - 1))
+    actor_alpha: float = 7
+    actor_chunk: int = 50      # transitions per message sent to the learner
+    actor_sync: int = 400      # actor steps between checks for fresh weights
+    publish_every: int = 100   # learner steps between weight broadcasts
+
+PRESETS = {"main": ApexConfig()}
+
+def actor_epsilon(c, actor_id):
+    if c.num_actors == 1:
+        return c.actor_eps
+    return c.actor_eps ** (1 + c.actor_alpha * actor_id / (c.num_actors - 1))
+
+def actor(c, actor_id, shared_net, version, lock, transitions, stop):
+    torch.set_num_threads(1)
+    seed = c.seed + actor_id
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+
+    env = make_env(c.env_name, **make_env_kwargs(c))
+    state_dim = env.observation_space.shape[0]
+    action_dim = env.action_space.n
+    epsilon = actor_epsilon(c, actor_id)
+
+    local_net = DQN(state_dim, action_dim, c.hidden_dim, c.hidden_layers)
+    local_net.eval()
+    local_version = -1
+
+    chunk = []
+    state, _ = env.reset(seed=seed)
+    total_reward = 0
+    step = 0
+    while not stop.is_set():
+        # refresh weights from the learner's shared copy
+        if step % c.actor_sync == 0 and version.value != local_version:
+            with lock:
+                local_net.load_state_dict(shared_net.state_dict())
+                local_version = version.value
+
+        # Epsilon-greedy action
+        if np.random.random() < epsilon:
+            action = np.random.randint(action_dim)
+        else:
+            with torch.no_grad():
+                state_tensor = torch.as_tensor(state, dtype=torch.float32).unsqueeze(0)
+                action = local_net(state_tensor).argmax().item()
+
+        next_state, reward, terminated, truncated, _ = env.step(action)
+        done = terminated or truncated
+        chunk.append((state, action, reward, next_state, done))
+        state = next_state
+        total_reward += reward
+        step += 1
+
+        episode_reward = None
+        if done:
+            episode_reward = total_reward
+            state, _ = env.reset()
+            total_reward = 0
+
+        if len(chunk) >= c.actor_chunk or episode_reward is not None:
+            states, actions, rewards, next_states, dones = zip(*chunk)
+            batch = (
+                np.array(states, dtype=np.float32),
+                np.array(actions, dtype=np.int64),
+                np.array(rewards, dtype=np.float32),
+                np.array(next_states, dtype=np.float32),
+                np.array(dones, dtype=np.float32),
+            )
+            chunk = []
+            while not stop.is_set():
+                try:
+                    transitions.put((actor_id, batch, episode_reward), timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    env.close()
+
+def learner(config):
+    c = config
+    run_path = partial(os.path.join, c.run_dir)
+    os.makedirs(c.run_dir, exist_ok=True)
+    MODEL_PATH = run_path(c.model_file)
+    MODEL_NPZ_PATH = os.path.splitext(MODEL_PATH)[0] + ".npz"
+    STATE_PATH = run_path(c.state_file)
+    with open(run_path("config.json"), "w") as f:
+        json.dump(dataclasses.asdict(c), f, indent=2)
+    WARMUP_SIZE = c.warmup_size if c.warmup_size is not None else c.memory_size // 2
+    set_threads(c.threads)
+
+    torch.manual_seed(c.seed)
+    np.random.seed(c.seed)
+    random.seed(c.seed)
+
+    sensor_grid = tuple(c.sensor_grid)
+    env_kwargs = make_env_kwargs(c)
+    env = make_env(c.env_name, **env_kwargs)
+    state_dim = env.observation_space.shape[0]
+    action_dim = env.action_space.n
+    env.close()
+
+    policy_net = DQN(state_dim, action_dim, c.hidden_dim, c.hidden_layers)
+    target_net = DQN(state_dim, action_dim, c.hidden_dim, c.hidden_layers)
+    target_net.load_state_dict(policy_net.state_dict())
+    target_net.eval()
+    optimizer = optim.Adam(policy_net.parameters(), lr=c.lr)
+
+    # weights are broadcast to the actors through shared memory, not pickled per update
+    shared_net = DQN(state_dim, action_dim, c.hidden_dim, c.hidden_layers)
+    shared_net.load_state_dict(policy_net.state_dict())
+    shared_net.share_memory()
+    version = mp.Value('l', 0)
+    lock = mp.Lock()
+    transitions = mp.Queue(maxsize=4 * c.num_actors)
+    stop = mp.Event()
+
+    actors = [
+        mp.Process(target=actor, args=(c, i, shared_net, version, lock, transitions, stop), daemon=True)
+        for i in range(c.num_actors)
+    ]
+    for p in actors:
+        p.start()
+
+    memory = ReplayBuffer(c.memory_size, state_dim)
+    updater = DQNUpdater(policy_net, target_net, optimizer, c.gamma, c.batch_size, state_dim)
+    rewards_per_episode = []
+    test_rewards = []
+    test_episodes = []
+    episode = 0
+    learner_steps = 0
+    checkpoint_writer = CheckpointWriter()
+    progress_bar = tqdm(total=c.episodes, desc="Avg Reward (last 10): None", dynamic_ncols=True)
+
+    while episode < c.episodes:
+        # drain whatever the actors have produced so far
+        finished = []
+        for _ in range(2 * c.num_actors):
+            try:
+                actor_id, batch, episode_reward = transitions.get(timeout=0.01 if len(memory) < WARMUP_SIZE else 0)
+            except queue.Empty:
+                break
+            memory.push_batch(*batch)
+            if episode_reward is not None:
+                finished.append(episode_reward)
+
+        if len(memory) >= WARMUP_SIZE:
+            memory.sample(c.batch_size, out=updater.buffers)
+            updater.step()
+            learner_steps += 1
+
+            if learner_steps % c.publish_every == 0:
+                with lock:
+                    with torch.no_grad():
+                        for shared_param, param in zip(shared_net.parameters(), policy_net.parameters()):
+                            shared_param.copy_(param)
+                    version.value += 1
+
+        for total_reward in finished:
+            if episode >= c.episodes:
+                break
+            rewards_per_episode.append(total_reward)
+
+            if (episode+1) % c.target_update == 0:
+                # update target_network
+                target_net.load_state_dict(policy_net.state_dict())
+
+                # evaluate current model
+                test_reward_mean = evaluate_model(
+                    policy_net,
+                    c.env_name,
+                    render_mode=None,
+                    episodes=c.eval_episodes,
+                    verbose=False,
+                    **env_kwargs
+                )
+                test_rewards.append(test_reward_mean)
+                test_episodes.append(episode)
+
+                # save training state and policy (same files as train.py, so evaluate.py and video.py can load it)
+                checkpoint = {
+                    "state_dict": policy_net.state_dict(),
+                    "hidden_dim": c.hidden_dim,
+                    "hidden_layers": c.hidden_layers,
+                    "optimizer_state_dict": optimizer.state_dict(),
+                    "episode": episode,
+                    "epsilon": c.actor_eps,
+                    "rewards_per_episode": rewards_per_episode,
+                    "reward": np.mean(rewards_per_episode[-10:]) if len(rewards_per_episode) >= 10 else None,
+                    "test_rewards": test_rewards,
+                    "test_episodes": test_episodes,
+                    "sensor_grid": sensor_grid,
+                    "action_dim": action_dim,
+                    "track": c.track,
+                    "max_steps": c.max_steps,
+                    "hitbox": c.hitbox,
+                    "x_spacing": c.x_spacing,
+                    "y_spacing": c.y_spacing,
+                }
+                checkpoint_writer.save(checkpoint, STATE_PATH)
+                checkpoint_writer.save(policy_artifact(checkpoint), MODEL_PATH, MODEL_NPZ_PATH)
+
+            if (episode) % 10 == 0:
+                avg_reward = np.mean(rewards_per_episode[-10:])
+                progress_bar.set_description(f"Avg Reward (last 10): {avg_reward:.2f}, Learner steps: {learner_steps}")
+
+            episode += 1
+            progress_bar.update(1)
+
+    stop.set()
+    # keep draining so no actor blocks on a full queue while shutting down
+    while any(p.is_alive() for p in actors):
+        try:
+            transitions.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    for p in actors:
+        p.join()
+    checkpoint_writer.close()
+    progress_bar.close()
+
+def main(argv=None):
+    learner(parse_config(argv, presets=PRESETS))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import multiprocessing as mp
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import torch
+
+from evaluate import evaluate_model
+from models import DQN
+
+def _worker_init():
+    import line_follower_v0  # registers the env in the worker
+    torch.set_num_threads(1)
+
+def evaluate_snapshot(state_dict, model_args, env_name, env_kwargs, episodes, tolerance=None, batch_episodes=20):
+    model = DQN(*model_args)
+    model.load_state_dict(state_dict)
+    model.eval()
+    return evaluate_model(model, env_name, render_mode=None, episodes=episodes, verbose=False,
+                          tolerance=tolerance, batch_episodes=batch_episodes, **env_kwargs)
+
+# Runs evaluate_model on a pool of worker processes against frozen copies of
+# the policy weights, so the training loop does not wait for evaluations.
+# Results come back tagged with the episode they were submitted for, in
+# submission order. With max_workers=0 evaluations run inline instead. With a
+# tolerance, evaluations stop early (see evaluate_model) and each result is a
+# (mean, CI half-width, episodes used) tuple.
+class AsyncEvaluator:
+    def __init__(self, model_args, env_name, env_kwargs, episodes, max_workers=2, tolerance=None, batch_episodes=20):
+        self.model_args = model_args
+        self.env_name = env_name
+        self.env_kwargs = env_kwargs
+        self.episodes = episodes
+        self.tolerance = tolerance
+        self.batch_episodes = batch_episodes
+        self.pending = deque()
+        self.pool = None
+        if max_workers > 0:
+            # spawn: the workers start at the first submit, when the training process
+            # already runs the checkpoint writer's and tqdm's threads, which fork
+            # would copy in whatever state they are in; _worker_init registers the env
+            self.pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_worker_init
+            )
+
+    def submit(self, episode, model):
+        state_dict = {k: v.detach().cpu().clone() for k, v in model.state_dict().items()}
+        args = (state_dict, self.model_args, self.env_name, self.env_kwargs, self.episodes, self.tolerance, self.batch_episodes)
+        if self.pool is None:
+            future = Future()
+            future.set_result(evaluate_snapshot(*args))
+        else:
+            future = self.pool.submit(evaluate_snapshot, *args)
+        self.pending.append((episode, future))
+
+    def collect(self, wait=False):
+        # (episode, result) pairs that are ready, oldest first
+        results = []
+        while self.pending and (wait or self.pending[0][1].done()):
+            episode, future = self.pending.popleft()
+            results.append((episode, future.result()))
+        return results
+
+    def close(self):
+        results = self.collect(wait=True)
+        if self.pool is not None:
+            self.pool.shutdown()
+        return results
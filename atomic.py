@@ -0,0 +1,24 @@
+import os, tempfile
+
+# os.umask can only be read by setting it, so it is read once at import
+# rather than from the checkpoint writer thread
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def atomic_write(data, path):
+    # write to a temp file in the same directory, then rename over the target,
+    # so a crash mid-write leaves the previous file intact
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        # mkstemp creates the file 0600; give it the mode a plain open() would
+        os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,245 @@
+import argparse, json, os, platform, sys, tempfile, time
+from functools import partial
+import gymnasium as gym
+import numpy as np
+import torch
+
+import line_follower_v0
+from bench_update import bench as bench_grad_steps
+from replay_buffer import ReplayBuffer
+from train import TrainConfig
+
+# CPU benchmarks of the hot paths of training and rendering. Each benchmark
+# returns {metric: (value, unit)}; the suite writes them as JSON and, given a
+# baseline file from an earlier run, flags every metric that got worse by
+# more than --tolerance. Rates ("/s") are better higher, times ("us", "ms")
+# lower. Every measurement is the best of --repeat runs.
+#   python bench.py --save_baseline            # on the reference commit
+#   python bench.py                            # later: compare, exit 1 on regressions
+
+RESULTS_PATH = "bench_results.json"
+BASELINE_PATH = "bench_baseline.json"
+LOWER_IS_BETTER = ("us", "ms")
+
+CONFIG = TrainConfig()
+ENV_KWARGS = dict(
+    sensor_grid=CONFIG.sensor_grid,
+    track=CONFIG.track,
+    max_steps=CONFIG.max_steps,
+    hitbox=CONFIG.hitbox,
+    x_spacing=CONFIG.x_spacing,
+    y_spacing=CONFIG.y_spacing,
+)
+STATE_DIM = CONFIG.sensor_grid[0] * CONFIG.sensor_grid[1]
+ACTION_DIM = 3
+GRAD_SIZES = [(32, 1), (128, 2), (256, 3)]  # (hidden_dim, hidden_layers)
+
+def best_time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def make_policy(hidden_dim=CONFIG.hidden_dim, hidden_layers=CONFIG.hidden_layers):
+    from models import DQN
+    torch.manual_seed(0)
+    return DQN(STATE_DIM, ACTION_DIM, hidden_dim, hidden_layers).eval()
+
+def policy_artifact_for(policy_net, hidden_dim=CONFIG.hidden_dim, hidden_layers=CONFIG.hidden_layers):
+    return dict(ENV_KWARGS, action_dim=ACTION_DIM, hidden_dim=hidden_dim, hidden_layers=hidden_layers, episode=0, state_dict=policy_net.state_dict())
+
+def bench_env(scale, repeat):
+    results = {}
+    for render_mode in (None, "rgb_array"):
+        steps = int((5000 if render_mode is None else 500) * scale)
+        env = gym.make("my_gym_envs/line_follower_v0", render_mode=render_mode, **ENV_KWARGS)
+        actions = np.random.default_rng(0).integers(ACTION_DIM, size=steps)
+
+        def run():
+            env.reset(seed=0)
+            for action in actions:
+                _, _, terminated, truncated, _ = env.step(int(action))
+                if render_mode is not None:
+                    env.render()
+                if terminated or truncated:
+                    env.reset()
+        results[f"env_steps_{render_mode or 'none'}"] = (steps / best_time(run, repeat), "steps/s")
+        env.close()
+    return results
+
+def bench_action(scale, repeat):
+    from numpy_policy import NumpyPolicy
+    from qtable import QTable
+    n = int(5000 * scale)
+    states = (np.random.default_rng(0).random((n, STATE_DIM)) < 0.3).astype(np.float32)
+    policy_net = make_policy()
+    numpy_policy = NumpyPolicy({k: v.numpy() for k, v in policy_net.state_dict().items()})
+    q_table = QTable(numpy_policy, STATE_DIM)
+
+    def torch_act():
+        for state in states:
+            with torch.no_grad():
+                policy_net(torch.as_tensor(state).unsqueeze(0)).argmax(1).numpy()
+
+    def run(act):
+        return lambda: [act(state) for state in states]
+    return {
+        "action_latency_torch": (1e6 * best_time(torch_act, repeat) / n, "us"),
+        "action_latency_numpy": (1e6 * best_time(run(numpy_policy.act), repeat) / n, "us"),
+        "action_latency_qtable": (1e6 * best_time(run(q_table.act), repeat) / n, "us"),
+    }
+
+def bench_replay(scale, repeat):
+    n = int(20_000 * scale)
+    rng = np.random.default_rng(0)
+    states = (rng.random((n, STATE_DIM)) < 0.3).astype(np.float32)
+    actions = rng.integers(ACTION_DIM, size=n)
+    rewards = rng.random(n).astype(np.float32)
+    memory = ReplayBuffer(CONFIG.memory_size, STATE_DIM)
+
+    def push():
+        for i in range(n - 1):
+            memory.push(states[i], actions[i], rewards[i], states[i+1], False)
+
+    batches = int(2000 * scale)
+    def sample():
+        for _ in range(batches):
+            memory.sample(CONFIG.batch_size)
+    return {
+        "replay_push": (n / best_time(push, repeat), "transitions/s"),
+        "replay_sample": (batches / best_time(sample, repeat), "batches/s"),
+    }
+
+def bench_grad(scale, repeat):
+    steps = int(500 * scale)
+    results = {}
+    for hidden_dim, hidden_layers in GRAD_SIZES:
+        sps = max(bench_grad_steps(STATE_DIM, ACTION_DIM, hidden_dim, hidden_layers, steps, steps // 10, ["eager"])["eager"] for _ in range(repeat))
+        results[f"grad_steps_{hidden_dim}x{hidden_layers}"] = (sps, "steps/s")
+    return results
+
+def bench_evaluate(scale, repeat):
+    from evaluate import evaluate_model
+    from numpy_policy import NumpyPolicy
+    episodes = max(1, int(20 * scale))
+    policy_net = make_policy()
+    numpy_policy = NumpyPolicy({k: v.numpy() for k, v in policy_net.state_dict().items()})
+
+    def run(policy):
+        return lambda: evaluate_model(policy, "line_follower_v0", None, episodes=episodes, **ENV_KWARGS)
+    return {
+        "evaluate_torch": (episodes / best_time(run(policy_net), repeat), "episodes/s"),
+        "evaluate_numpy": (episodes / best_time(run(numpy_policy), repeat), "episodes/s"),
+    }
+
+def bench_checkpoint(scale, repeat):
+    from checkpoint import atomic_save, load_policy, load_training_state
+    from numpy_policy import load_numpy_policy
+    hidden_dim, hidden_layers = GRAD_SIZES[-1]
+    policy_net = make_policy(hidden_dim, hidden_layers)
+    artifact = policy_artifact_for(policy_net, hidden_dim, hidden_layers)
+    optimizer = torch.optim.Adam(policy_net.parameters())
+    policy_net(torch.zeros(1, STATE_DIM)).sum().backward()
+    optimizer.step()  # populate the Adam moments
+    state = dict(artifact, optimizer_state_dict=optimizer.state_dict(), rewards_per_episode=list(np.random.random(CONFIG.episodes)),
+                 test_rewards=[], test_episodes=[], test_env_steps=[])
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = partial(os.path.join, directory)
+        cases = [
+            ("policy_pth", artifact, path("policy.pth"), load_policy),
+            ("policy_npz", artifact, path("policy.npz"), load_numpy_policy),
+            ("training_state", state, path("training_state.pth"), load_training_state),
+        ]
+        for name, obj, file_path, load in cases:
+            results[f"save_{name}"] = (1e3 * best_time(lambda: atomic_save(obj, file_path), repeat), "ms")
+            results[f"load_{name}"] = (1e3 * best_time(lambda: load(file_path), repeat), "ms")
+    return results
+
+def bench_plot(scale, repeat):
+    import plot_graphs
+    episodes = CONFIG.episodes
+    rng = np.random.default_rng(0)
+    test_episodes = np.arange(0, episodes, CONFIG.target_update)
+    history = rng.normal(size=episodes).cumsum(), test_episodes, rng.normal(size=len(test_episodes)).cumsum()
+    plot_graphs._init_worker(history)
+    frames = max(1, int(10 * scale))
+    with tempfile.TemporaryDirectory() as directory:
+        def run():
+            for i in range(frames):
+                plot_graphs.render_frame(episodes * (i + 1) // frames - 1, os.path.join(directory, f"{i:04d}.png"))
+        return {"plot_frames": (frames / best_time(run, repeat), "frames/s")}
+
+BENCHMARKS = {
+    "env": bench_env,
+    "action": bench_action,
+    "replay": bench_replay,
+    "grad": bench_grad,
+    "evaluate": bench_evaluate,
+    "checkpoint": bench_checkpoint,
+    "plot": bench_plot,
+}
+
+def compare(results, baseline, tolerance):
+    # metric -> relative change (positive = better) for every metric in both runs
+    changes = {}
+    for metric, entry in results.items():
+        if metric not in baseline:
+            continue
+        old, new = baseline[metric]["value"], entry["value"]
+        change = (new - old) / old
+        changes[metric] = -change if entry["unit"] in LOWER_IS_BETTER else change
+    regressions = [m for m, change in changes.items() if change < -tolerance]
+    return changes, regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the training and rendering hot paths on CPU.")
+    parser.add_argument("--only", type=str, nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS), help="Benchmarks to run.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on the iterations of every benchmark.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best one is kept.")
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads.")
+    parser.add_argument("--output", type=str, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=str, default=BASELINE_PATH)
+    parser.add_argument("--save_baseline", action="store_true", help="Write the results to --baseline instead of comparing.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative slowdown reported as a regression.")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    results = {}
+    for name in args.only:
+        print(f"{name} ...", flush=True)
+        for metric, (value, unit) in BENCHMARKS[name](args.scale, args.repeat).items():
+            results[metric] = {"value": value, "unit": unit}
+            print(f"  {metric:<24} {value:12.2f} {unit}")
+
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "torch": torch.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "threads": args.threads,
+            "scale": args.scale,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.baseline if args.save_baseline else args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline or not os.path.exists(args.baseline):
+        raise SystemExit
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    changes, regressions = compare(results, baseline["results"], args.tolerance)
+    print(f"\nagainst {args.baseline} ({baseline['meta']['time']}):")
+    for metric, change in changes.items():
+        flag = "  REGRESSION" if metric in regressions else ""
+        print(f"  {metric:<24} {change:+7.1%}{flag}")
+    if regressions:
+        sys.exit(1)
@@ -0,0 +1,92 @@
+import argparse, time
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.optim as optim
+
+from dqn_update import DQNUpdater
+from models import DQN
+from replay_buffer import ReplayBuffer
+
+# Gradient steps/sec on CPU: the original per-step update from main.py
+# ("legacy") against DQNUpdater, eager and torch.compile'd.
+
+GAMMA = 0.9
+LR = 2e-5
+BATCH_SIZE = 256
+MEMORY_SIZE = 20_000
+
+def make_memory(state_dim, action_dim):
+    memory = ReplayBuffer(MEMORY_SIZE, state_dim)
+    n = MEMORY_SIZE
+    memory.push_batch(
+        (np.random.random((n, state_dim)) < 0.3).astype(np.float32),
+        np.random.randint(action_dim, size=n),
+        np.random.random(n).astype(np.float32),
+        (np.random.random((n, state_dim)) < 0.3).astype(np.float32),
+        (np.random.random(n) < 0.01).astype(np.float32),
+    )
+    return memory
+
+def legacy_step(memory, policy_net, target_net, optimizer):
+    states, actions, rewards, next_states, dones = memory.sample(BATCH_SIZE)
+
+    states = torch.FloatTensor(states)
+    actions = torch.LongTensor(actions).unsqueeze(1)
+    rewards = torch.FloatTensor(rewards).unsqueeze(1)
+    next_states = torch.FloatTensor(next_states)
+    dones = torch.FloatTensor(dones).unsqueeze(1)
+
+    q_values = policy_net(states).gather(1, actions)
+    next_q_values = target_net(next_states).max(1, keepdim=True)[0]
+    expected_q_values = rewards + GAMMA * next_q_values * (1 - dones)
+
+    loss = nn.MSELoss()(q_values, expected_q_values.detach())
+
+    optimizer.zero_grad()
+    loss.backward()
+    optimizer.step()
+
+def steps_per_second(step, steps, warmup):
+    for _ in range(warmup):
+        step()
+    start = time.perf_counter()
+    for _ in range(steps):
+        step()
+    return steps / (time.perf_counter() - start)
+
+def bench(state_dim, action_dim, hidden_dim, hidden_layers, steps, warmup, modes):
+    memory = make_memory(state_dim, action_dim)
+    results = {}
+    for mode in modes:
+        torch.manual_seed(0)
+        policy_net = DQN(state_dim, action_dim, hidden_dim, hidden_layers)
+        target_net = DQN(state_dim, action_dim, hidden_dim, hidden_layers)
+        target_net.load_state_dict(policy_net.state_dict())
+        optimizer = optim.Adam(policy_net.parameters(), lr=LR)
+        if mode == "legacy":
+            step = lambda: legacy_step(memory, policy_net, target_net, optimizer)
+        else:
+            updater = DQNUpdater(policy_net, target_net, optimizer, GAMMA, BATCH_SIZE, state_dim, compile=(mode == "compiled"))
+            def step():
+                memory.sample(BATCH_SIZE, out=updater.buffers)
+                updater.step()
+        results[mode] = steps_per_second(step, steps, warmup)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure DQN gradient steps/sec on CPU.")
+    parser.add_argument("--steps", type=int, default=2000, help="Timed gradient steps per configuration.")
+    parser.add_argument("--warmup", type=int, default=200, help="Untimed steps first (also triggers compilation).")
+    parser.add_argument("--state_dim", type=int, default=12, help="12 for sensor_grid=(4,3), 24 for (4,6).")
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op threads.")
+    parser.add_argument("--no_compile", action="store_true", help="Skip the torch.compile variant.")
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    modes = ["legacy", "eager"] + ([] if args.no_compile else ["compiled"])
+    for hidden_dim, hidden_layers in [(32, 1), (256, 3)]:
+        results = bench(args.state_dim, 3, hidden_dim, hidden_layers, args.steps, args.warmup, modes)
+        line = ", ".join(f"{mode}: {sps:8.1f} steps/s" for mode, sps in results.items())
+        print(f"hidden_dim={hidden_dim:3d} hidden_layers={hidden_layers}  {line}  (x{results['eager']/results['legacy']:.2f} eager)")
@@ -0,0 +1,123 @@
+import io, os, pickle, queue, threading
+import numpy as np
+import torch
+
+from atomic import atomic_write
+from models import DQN
+from numpy_policy import read_policy_npz
+
+# A training run writes two files: the full training state (optimizer, reward
+# history, ...) needed to resume, and a small policy artifact with just the
+# weights and the network/env parameters, which is what evaluation, videos and
+# analysis load. The policy artifact is a plain dict that loads with
+# torch.load(weights_only=True), or a flat .npz when saved under that suffix.
+
+POLICY_KEYS = ("sensor_grid", "action_dim", "hidden_dim", "hidden_layers", "track", "max_steps", "hitbox", "x_spacing", "y_spacing", "episode")
+
+def policy_artifact(checkpoint):
+    # plain Python values only, so the artifact loads with weights_only=True
+    artifact = {k: checkpoint[k].item() if isinstance(checkpoint[k], np.generic) else checkpoint[k] for k in POLICY_KEYS}
+    artifact["state_dict"] = checkpoint["state_dict"]
+    return artifact
+
+def policy_to_npz(artifact):
+    arrays = {f"state_dict.{k}": v.detach().cpu().numpy() for k, v in artifact["state_dict"].items()}
+    arrays.update({k: np.asarray(artifact[k]) for k in POLICY_KEYS})
+    return arrays
+
+def load_policy(path):
+    # returns (DQN in eval mode, artifact dict)
+    if path.endswith(".npz"):
+        artifact = read_policy_npz(path)
+        artifact["state_dict"] = {k: torch.from_numpy(v) for k, v in artifact["state_dict"].items()}
+    else:
+        try:
+            artifact = torch.load(path, map_location="cpu", weights_only=True)
+        except pickle.UnpicklingError:
+            # full checkpoint written before training state and policy were split
+            artifact = torch.load(path, map_location="cpu", weights_only=False)
+    sensor_grid = artifact["sensor_grid"]
+    policy_net = DQN(sensor_grid[0] * sensor_grid[1], artifact["action_dim"], artifact["hidden_dim"], artifact["hidden_layers"])
+    policy_net.load_state_dict(artifact["state_dict"])
+    policy_net.eval()
+    return policy_net, artifact
+
+def load_training_state(*paths):
+    # first of `paths` holding a resumable training state; older runs kept it
+    # in the model file itself
+    for path in paths:
+        if os.path.exists(path):
+            state = torch.load(path, map_location="cpu", weights_only=False)
+            if "optimizer_state_dict" in state:
+                return state
+    return None
+
+def snapshot(obj):
+    # copy of a checkpoint dict that the training loop can keep mutating:
+    # tensors are cloned, containers are copied, everything else is shared
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().clone()
+    if isinstance(obj, dict):
+        return {k: snapshot(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [snapshot(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(snapshot(v) for v in obj)
+    return obj
+
+def serialize(obj, path):
+    buffer = io.BytesIO()
+    if path.endswith(".npz"):
+        np.savez(buffer, **policy_to_npz(obj))
+    else:
+        torch.save(obj, buffer)
+    return buffer.getvalue()
+
+def atomic_save(obj, *paths):
+    data = {}
+    for path in paths:
+        fmt = os.path.splitext(path)[1] == ".npz"
+        if fmt not in data:
+            data[fmt] = serialize(obj, path)
+        atomic_write(data[fmt], path)
+
+# Writes checkpoints on a background thread. save() snapshots the state in the
+# caller's thread, so training can continue while the file is serialized and
+# written; the same snapshot can go to several paths.
+class CheckpointWriter:
+    def __init__(self, max_pending=4):
+        self.jobs = queue.Queue(maxsize=max_pending)
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            obj, paths = job
+            try:
+                atomic_save(obj, *paths)
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.jobs.task_done()
+
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def save(self, obj, *paths):
+        self._raise_error()
+        self.jobs.put((snapshot(obj), paths))
+
+    def flush(self):
+        self.jobs.join()
+        self._raise_error()
+
+    def close(self):
+        self.jobs.put(None)
+        self.thread.join()
+        self._raise_error()
@@ -1,760 +0,0 @@
-python video.py --model_path for_video/saved_models/0050.pth --save_dir for_video/runs/0050 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0050.pth --save_dir for_video/runs/0050 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0050.pth --save_dir for_video/runs/0050 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0050.pth --save_dir for_video/runs/0050 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0050.pth --save_dir for_video/runs/0050 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0050.pth --save_dir for_video/runs/0050 --filename run_6.npy --save_threshold -100   &
-wait
-
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0050/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0050/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0050/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0050/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0050/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0050/run_6.npy 0050.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 50"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0050.png  &
-
-python video.py --model_path for_video/saved_models/0060.pth --save_dir for_video/runs/0060 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0060.pth --save_dir for_video/runs/0060 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0060.pth --save_dir for_video/runs/0060 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0060.pth --save_dir for_video/runs/0060 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0060.pth --save_dir for_video/runs/0060 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0060.pth --save_dir for_video/runs/0060 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0050
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0060/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0060/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0060/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0060/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0060/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0060/run_6.npy 0060.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 60"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0060.png &
-
-python video.py --model_path for_video/saved_models/0070.pth --save_dir for_video/runs/0070 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0070.pth --save_dir for_video/runs/0070 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0070.pth --save_dir for_video/runs/0070 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0070.pth --save_dir for_video/runs/0070 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0070.pth --save_dir for_video/runs/0070 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0070.pth --save_dir for_video/runs/0070 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0060
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0070/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0070/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0070/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0070/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0070/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0070/run_6.npy 0070.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 70"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0070.png &
-
-python video.py --model_path for_video/saved_models/0080.pth --save_dir for_video/runs/0080 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0080.pth --save_dir for_video/runs/0080 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0080.pth --save_dir for_video/runs/0080 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0080.pth --save_dir for_video/runs/0080 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0080.pth --save_dir for_video/runs/0080 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0080.pth --save_dir for_video/runs/0080 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0070
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0080/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0080/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0080/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0080/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0080/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0080/run_6.npy 0080.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 80"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0080.png &
-
-python video.py --model_path for_video/saved_models/0090.pth --save_dir for_video/runs/0090 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0090.pth --save_dir for_video/runs/0090 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0090.pth --save_dir for_video/runs/0090 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0090.pth --save_dir for_video/runs/0090 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0090.pth --save_dir for_video/runs/0090 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0090.pth --save_dir for_video/runs/0090 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0080
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0090/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0090/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0090/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0090/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0090/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0090/run_6.npy 0090.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 90"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0090.png &
-
-python video.py --model_path for_video/saved_models/0100.pth --save_dir for_video/runs/0100 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0100.pth --save_dir for_video/runs/0100 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0100.pth --save_dir for_video/runs/0100 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0100.pth --save_dir for_video/runs/0100 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0100.pth --save_dir for_video/runs/0100 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0100.pth --save_dir for_video/runs/0100 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0090
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0100/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0100/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0100/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0100/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0100/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0100/run_6.npy 0100.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 100"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0100.png &
-
-python video.py --model_path for_video/saved_models/0110.pth --save_dir for_video/runs/0110 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0110.pth --save_dir for_video/runs/0110 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0110.pth --save_dir for_video/runs/0110 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0110.pth --save_dir for_video/runs/0110 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0110.pth --save_dir for_video/runs/0110 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0110.pth --save_dir for_video/runs/0110 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0100
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0110/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0110/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0110/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0110/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0110/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0110/run_6.npy 0110.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 110"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0110.png &
-
-python video.py --model_path for_video/saved_models/0120.pth --save_dir for_video/runs/0120 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0120.pth --save_dir for_video/runs/0120 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0120.pth --save_dir for_video/runs/0120 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0120.pth --save_dir for_video/runs/0120 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0120.pth --save_dir for_video/runs/0120 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0120.pth --save_dir for_video/runs/0120 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0110
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0120/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0120/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0120/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0120/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0120/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0120/run_6.npy 0120.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 120"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0120.png &
-
-python video.py --model_path for_video/saved_models/0130.pth --save_dir for_video/runs/0130 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0130.pth --save_dir for_video/runs/0130 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0130.pth --save_dir for_video/runs/0130 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0130.pth --save_dir for_video/runs/0130 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0130.pth --save_dir for_video/runs/0130 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0130.pth --save_dir for_video/runs/0130 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0120
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0130/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0130/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0130/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0130/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0130/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0130/run_6.npy 0130.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 130"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0130.png &
-
-python video.py --model_path for_video/saved_models/0140.pth --save_dir for_video/runs/0140 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0140.pth --save_dir for_video/runs/0140 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0140.pth --save_dir for_video/runs/0140 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0140.pth --save_dir for_video/runs/0140 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0140.pth --save_dir for_video/runs/0140 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0140.pth --save_dir for_video/runs/0140 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0130
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0140/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0140/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0140/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0140/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0140/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0140/run_6.npy 0140.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 140"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0140.png &
-
-python video.py --model_path for_video/saved_models/0150.pth --save_dir for_video/runs/0150 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0150.pth --save_dir for_video/runs/0150 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0150.pth --save_dir for_video/runs/0150 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0150.pth --save_dir for_video/runs/0150 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0150.pth --save_dir for_video/runs/0150 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0150.pth --save_dir for_video/runs/0150 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0140
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0150/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0150/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0150/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0150/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0150/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0150/run_6.npy 0150.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 150"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0150.png &
-
-python video.py --model_path for_video/saved_models/0160.pth --save_dir for_video/runs/0160 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0160.pth --save_dir for_video/runs/0160 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0160.pth --save_dir for_video/runs/0160 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0160.pth --save_dir for_video/runs/0160 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0160.pth --save_dir for_video/runs/0160 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0160.pth --save_dir for_video/runs/0160 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0150
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0160/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0160/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0160/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0160/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0160/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0160/run_6.npy 0160.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 160"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0160.png &
-
-python video.py --model_path for_video/saved_models/0170.pth --save_dir for_video/runs/0170 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0170.pth --save_dir for_video/runs/0170 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0170.pth --save_dir for_video/runs/0170 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0170.pth --save_dir for_video/runs/0170 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0170.pth --save_dir for_video/runs/0170 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0170.pth --save_dir for_video/runs/0170 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0160
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0170/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0170/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0170/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0170/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0170/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0170/run_6.npy 0170.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 170"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0170.png &
-
-python video.py --model_path for_video/saved_models/0180.pth --save_dir for_video/runs/0180 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0180.pth --save_dir for_video/runs/0180 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0180.pth --save_dir for_video/runs/0180 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0180.pth --save_dir for_video/runs/0180 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0180.pth --save_dir for_video/runs/0180 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0180.pth --save_dir for_video/runs/0180 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0170
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0180/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0180/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0180/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0180/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0180/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0180/run_6.npy 0180.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 180"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0180.png &
-
-python video.py --model_path for_video/saved_models/0190.pth --save_dir for_video/runs/0190 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0190.pth --save_dir for_video/runs/0190 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0190.pth --save_dir for_video/runs/0190 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0190.pth --save_dir for_video/runs/0190 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0190.pth --save_dir for_video/runs/0190 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0190.pth --save_dir for_video/runs/0190 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0180
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0190/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0190/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0190/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0190/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0190/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0190/run_6.npy 0190.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 190"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0190.png &
-
-python video.py --model_path for_video/saved_models/0200.pth --save_dir for_video/runs/0200 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0200.pth --save_dir for_video/runs/0200 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0200.pth --save_dir for_video/runs/0200 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0200.pth --save_dir for_video/runs/0200 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0200.pth --save_dir for_video/runs/0200 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0200.pth --save_dir for_video/runs/0200 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0190
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0200/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0200/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0200/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0200/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0200/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0200/run_6.npy 0200.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 200"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0200.png &
-
-python video.py --model_path for_video/saved_models/0210.pth --save_dir for_video/runs/0210 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0210.pth --save_dir for_video/runs/0210 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0210.pth --save_dir for_video/runs/0210 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0210.pth --save_dir for_video/runs/0210 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0210.pth --save_dir for_video/runs/0210 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0210.pth --save_dir for_video/runs/0210 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0200
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0210/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0210/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0210/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0210/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0210/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0210/run_6.npy 0210.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 210"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0210.png &
-
-python video.py --model_path for_video/saved_models/0220.pth --save_dir for_video/runs/0220 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0220.pth --save_dir for_video/runs/0220 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0220.pth --save_dir for_video/runs/0220 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0220.pth --save_dir for_video/runs/0220 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0220.pth --save_dir for_video/runs/0220 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0220.pth --save_dir for_video/runs/0220 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0210
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0220/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0220/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0220/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0220/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0220/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0220/run_6.npy 0220.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 220"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0220.png &
-
-python video.py --model_path for_video/saved_models/0230.pth --save_dir for_video/runs/0230 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0230.pth --save_dir for_video/runs/0230 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0230.pth --save_dir for_video/runs/0230 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0230.pth --save_dir for_video/runs/0230 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0230.pth --save_dir for_video/runs/0230 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0230.pth --save_dir for_video/runs/0230 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0220
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0230/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0230/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0230/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0230/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0230/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0230/run_6.npy 0230.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 230"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0230.png &
-
-python video.py --model_path for_video/saved_models/0240.pth --save_dir for_video/runs/0240 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0240.pth --save_dir for_video/runs/0240 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0240.pth --save_dir for_video/runs/0240 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0240.pth --save_dir for_video/runs/0240 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0240.pth --save_dir for_video/runs/0240 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0240.pth --save_dir for_video/runs/0240 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0230
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0240/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0240/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0240/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0240/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0240/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0240/run_6.npy 0240.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 240"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0240.png &
-
-python video.py --model_path for_video/saved_models/0250.pth --save_dir for_video/runs/0250 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0250.pth --save_dir for_video/runs/0250 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0250.pth --save_dir for_video/runs/0250 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0250.pth --save_dir for_video/runs/0250 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0250.pth --save_dir for_video/runs/0250 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0250.pth --save_dir for_video/runs/0250 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0240
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0250/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0250/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0250/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0250/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0250/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0250/run_6.npy 0250.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 250"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0250.png &
-
-python video.py --model_path for_video/saved_models/0260.pth --save_dir for_video/runs/0260 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0260.pth --save_dir for_video/runs/0260 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0260.pth --save_dir for_video/runs/0260 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0260.pth --save_dir for_video/runs/0260 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0260.pth --save_dir for_video/runs/0260 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0260.pth --save_dir for_video/runs/0260 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0250
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0260/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0260/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0260/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0260/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0260/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0260/run_6.npy 0260.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 260"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0260.png &
-
-python video.py --model_path for_video/saved_models/0270.pth --save_dir for_video/runs/0270 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0270.pth --save_dir for_video/runs/0270 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0270.pth --save_dir for_video/runs/0270 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0270.pth --save_dir for_video/runs/0270 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0270.pth --save_dir for_video/runs/0270 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0270.pth --save_dir for_video/runs/0270 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0260
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0270/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0270/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0270/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0270/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0270/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0270/run_6.npy 0270.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 270"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0270.png &
-
-python video.py --model_path for_video/saved_models/0280.pth --save_dir for_video/runs/0280 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0280.pth --save_dir for_video/runs/0280 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0280.pth --save_dir for_video/runs/0280 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0280.pth --save_dir for_video/runs/0280 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0280.pth --save_dir for_video/runs/0280 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0280.pth --save_dir for_video/runs/0280 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0270
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0280/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0280/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0280/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0280/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0280/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0280/run_6.npy 0280.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 280"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0280.png &
-
-python video.py --model_path for_video/saved_models/0290.pth --save_dir for_video/runs/0290 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0290.pth --save_dir for_video/runs/0290 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0290.pth --save_dir for_video/runs/0290 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0290.pth --save_dir for_video/runs/0290 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0290.pth --save_dir for_video/runs/0290 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0290.pth --save_dir for_video/runs/0290 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0280
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0290/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0290/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0290/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0290/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0290/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0290/run_6.npy 0290.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 290"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0290.png &
-
-python video.py --model_path for_video/saved_models/0300.pth --save_dir for_video/runs/0300 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0300.pth --save_dir for_video/runs/0300 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0300.pth --save_dir for_video/runs/0300 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0300.pth --save_dir for_video/runs/0300 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0300.pth --save_dir for_video/runs/0300 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0300.pth --save_dir for_video/runs/0300 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0290
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0300/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0300/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0300/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0300/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0300/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0300/run_6.npy 0300.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 300"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0300.png &
-
-python video.py --model_path for_video/saved_models/0310.pth --save_dir for_video/runs/0310 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0310.pth --save_dir for_video/runs/0310 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0310.pth --save_dir for_video/runs/0310 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0310.pth --save_dir for_video/runs/0310 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0310.pth --save_dir for_video/runs/0310 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0310.pth --save_dir for_video/runs/0310 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0300
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0310/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0310/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0310/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0310/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0310/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0310/run_6.npy 0310.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 310"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0310.png &
-
-python video.py --model_path for_video/saved_models/0320.pth --save_dir for_video/runs/0320 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0320.pth --save_dir for_video/runs/0320 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0320.pth --save_dir for_video/runs/0320 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0320.pth --save_dir for_video/runs/0320 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0320.pth --save_dir for_video/runs/0320 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0320.pth --save_dir for_video/runs/0320 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0310
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0320/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0320/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0320/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0320/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0320/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0320/run_6.npy 0320.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 320"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0320.png &
-
-python video.py --model_path for_video/saved_models/0330.pth --save_dir for_video/runs/0330 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0330.pth --save_dir for_video/runs/0330 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0330.pth --save_dir for_video/runs/0330 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0330.pth --save_dir for_video/runs/0330 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0330.pth --save_dir for_video/runs/0330 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0330.pth --save_dir for_video/runs/0330 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0320
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0330/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0330/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0330/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0330/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0330/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0330/run_6.npy 0330.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 330"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0330.png &
-
-python video.py --model_path for_video/saved_models/0340.pth --save_dir for_video/runs/0340 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0340.pth --save_dir for_video/runs/0340 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0340.pth --save_dir for_video/runs/0340 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0340.pth --save_dir for_video/runs/0340 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0340.pth --save_dir for_video/runs/0340 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0340.pth --save_dir for_video/runs/0340 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0330
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0340/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0340/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0340/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0340/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0340/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0340/run_6.npy 0340.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 340"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0340.png &
-
-python video.py --model_path for_video/saved_models/0350.pth --save_dir for_video/runs/0350 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0350.pth --save_dir for_video/runs/0350 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0350.pth --save_dir for_video/runs/0350 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0350.pth --save_dir for_video/runs/0350 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0350.pth --save_dir for_video/runs/0350 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0350.pth --save_dir for_video/runs/0350 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0340
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0350/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0350/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0350/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0350/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0350/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0350/run_6.npy 0350.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 350"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0350.png &
-
-python video.py --model_path for_video/saved_models/0360.pth --save_dir for_video/runs/0360 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0360.pth --save_dir for_video/runs/0360 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0360.pth --save_dir for_video/runs/0360 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0360.pth --save_dir for_video/runs/0360 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0360.pth --save_dir for_video/runs/0360 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0360.pth --save_dir for_video/runs/0360 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0350
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0360/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0360/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0360/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0360/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0360/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0360/run_6.npy 0360.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 360"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0360.png &
-
-python video.py --model_path for_video/saved_models/0370.pth --save_dir for_video/runs/0370 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0370.pth --save_dir for_video/runs/0370 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0370.pth --save_dir for_video/runs/0370 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0370.pth --save_dir for_video/runs/0370 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0370.pth --save_dir for_video/runs/0370 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0370.pth --save_dir for_video/runs/0370 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0360
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0370/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0370/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0370/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0370/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0370/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0370/run_6.npy 0370.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 370"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0370.png &
-
-python video.py --model_path for_video/saved_models/0380.pth --save_dir for_video/runs/0380 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0380.pth --save_dir for_video/runs/0380 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0380.pth --save_dir for_video/runs/0380 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0380.pth --save_dir for_video/runs/0380 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0380.pth --save_dir for_video/runs/0380 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0380.pth --save_dir for_video/runs/0380 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0370
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0380/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0380/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0380/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0380/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0380/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0380/run_6.npy 0380.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 380"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0380.png &
-
-python video.py --model_path for_video/saved_models/0390.pth --save_dir for_video/runs/0390 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0390.pth --save_dir for_video/runs/0390 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0390.pth --save_dir for_video/runs/0390 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0390.pth --save_dir for_video/runs/0390 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0390.pth --save_dir for_video/runs/0390 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0390.pth --save_dir for_video/runs/0390 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0380
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0390/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0390/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0390/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0390/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0390/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0390/run_6.npy 0390.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 390"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0390.png &
-
-python video.py --model_path for_video/saved_models/0400.pth --save_dir for_video/runs/0400 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0400.pth --save_dir for_video/runs/0400 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0400.pth --save_dir for_video/runs/0400 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0400.pth --save_dir for_video/runs/0400 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0400.pth --save_dir for_video/runs/0400 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0400.pth --save_dir for_video/runs/0400 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0390
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0400/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0400/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0400/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0400/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0400/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0400/run_6.npy 0400.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 400"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0400.png &
-
-python video.py --model_path for_video/saved_models/0410.pth --save_dir for_video/runs/0410 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0410.pth --save_dir for_video/runs/0410 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0410.pth --save_dir for_video/runs/0410 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0410.pth --save_dir for_video/runs/0410 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0410.pth --save_dir for_video/runs/0410 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0410.pth --save_dir for_video/runs/0410 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0400
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0410/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0410/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0410/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0410/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0410/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0410/run_6.npy 0410.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 410"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0410.png &
-
-python video.py --model_path for_video/saved_models/0420.pth --save_dir for_video/runs/0420 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0420.pth --save_dir for_video/runs/0420 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0420.pth --save_dir for_video/runs/0420 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0420.pth --save_dir for_video/runs/0420 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0420.pth --save_dir for_video/runs/0420 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0420.pth --save_dir for_video/runs/0420 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0410
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0420/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0420/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0420/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0420/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0420/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0420/run_6.npy 0420.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 420"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0420.png &
-
-python video.py --model_path for_video/saved_models/0430.pth --save_dir for_video/runs/0430 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0430.pth --save_dir for_video/runs/0430 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0430.pth --save_dir for_video/runs/0430 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0430.pth --save_dir for_video/runs/0430 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0430.pth --save_dir for_video/runs/0430 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0430.pth --save_dir for_video/runs/0430 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0420
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0430/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0430/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0430/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0430/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0430/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0430/run_6.npy 0430.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 430"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0430.png &
-
-python video.py --model_path for_video/saved_models/0440.pth --save_dir for_video/runs/0440 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0440.pth --save_dir for_video/runs/0440 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0440.pth --save_dir for_video/runs/0440 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0440.pth --save_dir for_video/runs/0440 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0440.pth --save_dir for_video/runs/0440 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0440.pth --save_dir for_video/runs/0440 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0430
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0440/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0440/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0440/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0440/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0440/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0440/run_6.npy 0440.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 440"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0440.png &
-
-python video.py --model_path for_video/saved_models/0450.pth --save_dir for_video/runs/0450 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0450.pth --save_dir for_video/runs/0450 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0450.pth --save_dir for_video/runs/0450 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0450.pth --save_dir for_video/runs/0450 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0450.pth --save_dir for_video/runs/0450 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0450.pth --save_dir for_video/runs/0450 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0440
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0450/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0450/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0450/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0450/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0450/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0450/run_6.npy 0450.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 450"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0450.png &
-
-python video.py --model_path for_video/saved_models/0460.pth --save_dir for_video/runs/0460 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0460.pth --save_dir for_video/runs/0460 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0460.pth --save_dir for_video/runs/0460 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0460.pth --save_dir for_video/runs/0460 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0460.pth --save_dir for_video/runs/0460 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0460.pth --save_dir for_video/runs/0460 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0450
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0460/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0460/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0460/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0460/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0460/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0460/run_6.npy 0460.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 460"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0460.png &
-
-python video.py --model_path for_video/saved_models/0470.pth --save_dir for_video/runs/0470 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0470.pth --save_dir for_video/runs/0470 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0470.pth --save_dir for_video/runs/0470 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0470.pth --save_dir for_video/runs/0470 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0470.pth --save_dir for_video/runs/0470 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0470.pth --save_dir for_video/runs/0470 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0460
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0470/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0470/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0470/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0470/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0470/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0470/run_6.npy 0470.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 470"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0470.png &
-
-python video.py --model_path for_video/saved_models/0480.pth --save_dir for_video/runs/0480 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0480.pth --save_dir for_video/runs/0480 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0480.pth --save_dir for_video/runs/0480 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0480.pth --save_dir for_video/runs/0480 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0480.pth --save_dir for_video/runs/0480 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0480.pth --save_dir for_video/runs/0480 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0470
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0480/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0480/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0480/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0480/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0480/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0480/run_6.npy 0480.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 480"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0480.png &
-
-python video.py --model_path for_video/saved_models/0490.pth --save_dir for_video/runs/0490 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0490.pth --save_dir for_video/runs/0490 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0490.pth --save_dir for_video/runs/0490 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0490.pth --save_dir for_video/runs/0490 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0490.pth --save_dir for_video/runs/0490 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0490.pth --save_dir for_video/runs/0490 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0480
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0490/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0490/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0490/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0490/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0490/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0490/run_6.npy 0490.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 490"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0490.png &
-
-python video.py --model_path for_video/saved_models/0500.pth --save_dir for_video/runs/0500 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0500.pth --save_dir for_video/runs/0500 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0500.pth --save_dir for_video/runs/0500 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0500.pth --save_dir for_video/runs/0500 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0500.pth --save_dir for_video/runs/0500 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0500.pth --save_dir for_video/runs/0500 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0490
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0500/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0500/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0500/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0500/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0500/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0500/run_6.npy 0500.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 500"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0500.png &
-
-python video.py --model_path for_video/saved_models/0510.pth --save_dir for_video/runs/0510 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0510.pth --save_dir for_video/runs/0510 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0510.pth --save_dir for_video/runs/0510 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0510.pth --save_dir for_video/runs/0510 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0510.pth --save_dir for_video/runs/0510 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0510.pth --save_dir for_video/runs/0510 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0500
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0510/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0510/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0510/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0510/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0510/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0510/run_6.npy 0510.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 510"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0510.png &
-
-python video.py --model_path for_video/saved_models/0520.pth --save_dir for_video/runs/0520 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0520.pth --save_dir for_video/runs/0520 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0520.pth --save_dir for_video/runs/0520 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0520.pth --save_dir for_video/runs/0520 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0520.pth --save_dir for_video/runs/0520 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0520.pth --save_dir for_video/runs/0520 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0510
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0520/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0520/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0520/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0520/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0520/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0520/run_6.npy 0520.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 520"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0520.png &
-
-python video.py --model_path for_video/saved_models/0530.pth --save_dir for_video/runs/0530 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0530.pth --save_dir for_video/runs/0530 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0530.pth --save_dir for_video/runs/0530 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0530.pth --save_dir for_video/runs/0530 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0530.pth --save_dir for_video/runs/0530 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0530.pth --save_dir for_video/runs/0530 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0520
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0530/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0530/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0530/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0530/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0530/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0530/run_6.npy 0530.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 530"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0530.png &
-
-python video.py --model_path for_video/saved_models/0540.pth --save_dir for_video/runs/0540 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0540.pth --save_dir for_video/runs/0540 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0540.pth --save_dir for_video/runs/0540 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0540.pth --save_dir for_video/runs/0540 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0540.pth --save_dir for_video/runs/0540 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0540.pth --save_dir for_video/runs/0540 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0530
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0540/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0540/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0540/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0540/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0540/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0540/run_6.npy 0540.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 540"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0540.png &
-
-python video.py --model_path for_video/saved_models/0550.pth --save_dir for_video/runs/0550 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0550.pth --save_dir for_video/runs/0550 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0550.pth --save_dir for_video/runs/0550 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0550.pth --save_dir for_video/runs/0550 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0550.pth --save_dir for_video/runs/0550 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0550.pth --save_dir for_video/runs/0550 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0540
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0550/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0550/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0550/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0550/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0550/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0550/run_6.npy 0550.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 550"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0550.png &
-
-python video.py --model_path for_video/saved_models/0560.pth --save_dir for_video/runs/0560 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0560.pth --save_dir for_video/runs/0560 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0560.pth --save_dir for_video/runs/0560 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0560.pth --save_dir for_video/runs/0560 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0560.pth --save_dir for_video/runs/0560 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0560.pth --save_dir for_video/runs/0560 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0550
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0560/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0560/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0560/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0560/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0560/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0560/run_6.npy 0560.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 560"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0560.png &
-
-python video.py --model_path for_video/saved_models/0570.pth --save_dir for_video/runs/0570 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0570.pth --save_dir for_video/runs/0570 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0570.pth --save_dir for_video/runs/0570 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0570.pth --save_dir for_video/runs/0570 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0570.pth --save_dir for_video/runs/0570 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0570.pth --save_dir for_video/runs/0570 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0560
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0570/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0570/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0570/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0570/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0570/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0570/run_6.npy 0570.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 570"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0570.png &
-
-python video.py --model_path for_video/saved_models/0580.pth --save_dir for_video/runs/0580 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0580.pth --save_dir for_video/runs/0580 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0580.pth --save_dir for_video/runs/0580 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0580.pth --save_dir for_video/runs/0580 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0580.pth --save_dir for_video/runs/0580 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0580.pth --save_dir for_video/runs/0580 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0570
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0580/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0580/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0580/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0580/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0580/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0580/run_6.npy 0580.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 580"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0580.png &
-
-python video.py --model_path for_video/saved_models/0590.pth --save_dir for_video/runs/0590 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0590.pth --save_dir for_video/runs/0590 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0590.pth --save_dir for_video/runs/0590 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0590.pth --save_dir for_video/runs/0590 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0590.pth --save_dir for_video/runs/0590 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0590.pth --save_dir for_video/runs/0590 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0580
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0590/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0590/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0590/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0590/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0590/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0590/run_6.npy 0590.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 590"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0590.png &
-
-python video.py --model_path for_video/saved_models/0600.pth --save_dir for_video/runs/0600 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0600.pth --save_dir for_video/runs/0600 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0600.pth --save_dir for_video/runs/0600 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0600.pth --save_dir for_video/runs/0600 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0600.pth --save_dir for_video/runs/0600 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0600.pth --save_dir for_video/runs/0600 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0590
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0600/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0600/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0600/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0600/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0600/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0600/run_6.npy 0600.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 600"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0600.png &
-
-python video.py --model_path for_video/saved_models/0610.pth --save_dir for_video/runs/0610 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0610.pth --save_dir for_video/runs/0610 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0610.pth --save_dir for_video/runs/0610 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0610.pth --save_dir for_video/runs/0610 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0610.pth --save_dir for_video/runs/0610 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0610.pth --save_dir for_video/runs/0610 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0600
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0610/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0610/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0610/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0610/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0610/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0610/run_6.npy 0610.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 610"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0610.png &
-
-python video.py --model_path for_video/saved_models/0620.pth --save_dir for_video/runs/0620 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0620.pth --save_dir for_video/runs/0620 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0620.pth --save_dir for_video/runs/0620 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0620.pth --save_dir for_video/runs/0620 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0620.pth --save_dir for_video/runs/0620 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0620.pth --save_dir for_video/runs/0620 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0610
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0620/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0620/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0620/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0620/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0620/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0620/run_6.npy 0620.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 620"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0620.png &
-
-python video.py --model_path for_video/saved_models/0630.pth --save_dir for_video/runs/0630 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0630.pth --save_dir for_video/runs/0630 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0630.pth --save_dir for_video/runs/0630 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0630.pth --save_dir for_video/runs/0630 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0630.pth --save_dir for_video/runs/0630 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0630.pth --save_dir for_video/runs/0630 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0620
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0630/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0630/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0630/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0630/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0630/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0630/run_6.npy 0630.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 630"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0630.png &
-
-python video.py --model_path for_video/saved_models/0640.pth --save_dir for_video/runs/0640 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0640.pth --save_dir for_video/runs/0640 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0640.pth --save_dir for_video/runs/0640 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0640.pth --save_dir for_video/runs/0640 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0640.pth --save_dir for_video/runs/0640 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0640.pth --save_dir for_video/runs/0640 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0630
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0640/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0640/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0640/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0640/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0640/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0640/run_6.npy 0640.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 640"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0640.png &
-
-python video.py --model_path for_video/saved_models/0650.pth --save_dir for_video/runs/0650 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0650.pth --save_dir for_video/runs/0650 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0650.pth --save_dir for_video/runs/0650 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0650.pth --save_dir for_video/runs/0650 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0650.pth --save_dir for_video/runs/0650 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0650.pth --save_dir for_video/runs/0650 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0640
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0650/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0650/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0650/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0650/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0650/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0650/run_6.npy 0650.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 650"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0650.png &
-
-python video.py --model_path for_video/saved_models/0660.pth --save_dir for_video/runs/0660 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0660.pth --save_dir for_video/runs/0660 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0660.pth --save_dir for_video/runs/0660 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0660.pth --save_dir for_video/runs/0660 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0660.pth --save_dir for_video/runs/0660 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0660.pth --save_dir for_video/runs/0660 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0650
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0660/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0660/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0660/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0660/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0660/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0660/run_6.npy 0660.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 660"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0660.png &
-
-python video.py --model_path for_video/saved_models/0670.pth --save_dir for_video/runs/0670 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0670.pth --save_dir for_video/runs/0670 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0670.pth --save_dir for_video/runs/0670 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0670.pth --save_dir for_video/runs/0670 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0670.pth --save_dir for_video/runs/0670 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0670.pth --save_dir for_video/runs/0670 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0660
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0670/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0670/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0670/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0670/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0670/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0670/run_6.npy 0670.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 670"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0670.png &
-
-python video.py --model_path for_video/saved_models/0680.pth --save_dir for_video/runs/0680 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0680.pth --save_dir for_video/runs/0680 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0680.pth --save_dir for_video/runs/0680 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0680.pth --save_dir for_video/runs/0680 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0680.pth --save_dir for_video/runs/0680 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0680.pth --save_dir for_video/runs/0680 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0670
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0680/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0680/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0680/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0680/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0680/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0680/run_6.npy 0680.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 680"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0680.png &
-
-python video.py --model_path for_video/saved_models/0690.pth --save_dir for_video/runs/0690 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0690.pth --save_dir for_video/runs/0690 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0690.pth --save_dir for_video/runs/0690 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0690.pth --save_dir for_video/runs/0690 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0690.pth --save_dir for_video/runs/0690 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0690.pth --save_dir for_video/runs/0690 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0680
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0690/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0690/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0690/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0690/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0690/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0690/run_6.npy 0690.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 690"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0690.png &
-
-python video.py --model_path for_video/saved_models/0700.pth --save_dir for_video/runs/0700 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0700.pth --save_dir for_video/runs/0700 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0700.pth --save_dir for_video/runs/0700 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0700.pth --save_dir for_video/runs/0700 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0700.pth --save_dir for_video/runs/0700 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0700.pth --save_dir for_video/runs/0700 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0690
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0700/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0700/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0700/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0700/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0700/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0700/run_6.npy 0700.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 700"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0700.png &
-
-python video.py --model_path for_video/saved_models/0710.pth --save_dir for_video/runs/0710 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0710.pth --save_dir for_video/runs/0710 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0710.pth --save_dir for_video/runs/0710 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0710.pth --save_dir for_video/runs/0710 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0710.pth --save_dir for_video/runs/0710 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0710.pth --save_dir for_video/runs/0710 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0700
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0710/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0710/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0710/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0710/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0710/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0710/run_6.npy 0710.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 710"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0710.png &
-
-python video.py --model_path for_video/saved_models/0720.pth --save_dir for_video/runs/0720 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0720.pth --save_dir for_video/runs/0720 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0720.pth --save_dir for_video/runs/0720 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0720.pth --save_dir for_video/runs/0720 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0720.pth --save_dir for_video/runs/0720 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0720.pth --save_dir for_video/runs/0720 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0710
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0720/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0720/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0720/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0720/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0720/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0720/run_6.npy 0720.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 720"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0720.png &
-
-python video.py --model_path for_video/saved_models/0730.pth --save_dir for_video/runs/0730 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0730.pth --save_dir for_video/runs/0730 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0730.pth --save_dir for_video/runs/0730 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0730.pth --save_dir for_video/runs/0730 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0730.pth --save_dir for_video/runs/0730 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0730.pth --save_dir for_video/runs/0730 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0720
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0730/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0730/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0730/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0730/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0730/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0730/run_6.npy 0730.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 730"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0730.png
-
-python video.py --model_path for_video/saved_models/0740.pth --save_dir for_video/runs/0740 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0740.pth --save_dir for_video/runs/0740 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0740.pth --save_dir for_video/runs/0740 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0740.pth --save_dir for_video/runs/0740 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0740.pth --save_dir for_video/runs/0740 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0740.pth --save_dir for_video/runs/0740 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0730
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0740/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0740/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0740/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0740/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0740/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0740/run_6.npy 0740.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 740"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0740.png &
-
-python video.py --model_path for_video/saved_models/0750.pth --save_dir for_video/runs/0750 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0750.pth --save_dir for_video/runs/0750 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0750.pth --save_dir for_video/runs/0750 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0750.pth --save_dir for_video/runs/0750 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0750.pth --save_dir for_video/runs/0750 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0750.pth --save_dir for_video/runs/0750 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0740
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0750/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0750/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0750/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0750/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0750/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0750/run_6.npy 0750.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 750"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0750.png &
-
-python video.py --model_path for_video/saved_models/0760.pth --save_dir for_video/runs/0760 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0760.pth --save_dir for_video/runs/0760 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0760.pth --save_dir for_video/runs/0760 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0760.pth --save_dir for_video/runs/0760 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0760.pth --save_dir for_video/runs/0760 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0760.pth --save_dir for_video/runs/0760 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0750
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0760/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0760/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0760/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0760/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0760/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0760/run_6.npy 0760.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 760"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0760.png &
-
-python video.py --model_path for_video/saved_models/0770.pth --save_dir for_video/runs/0770 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0770.pth --save_dir for_video/runs/0770 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0770.pth --save_dir for_video/runs/0770 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0770.pth --save_dir for_video/runs/0770 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0770.pth --save_dir for_video/runs/0770 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0770.pth --save_dir for_video/runs/0770 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0760
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0770/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0770/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0770/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0770/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0770/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0770/run_6.npy 0770.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 770"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0770.png &
-
-python video.py --model_path for_video/saved_models/0780.pth --save_dir for_video/runs/0780 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0780.pth --save_dir for_video/runs/0780 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0780.pth --save_dir for_video/runs/0780 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0780.pth --save_dir for_video/runs/0780 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0780.pth --save_dir for_video/runs/0780 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0780.pth --save_dir for_video/runs/0780 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0770
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0780/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0780/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0780/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0780/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0780/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0780/run_6.npy 0780.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 780"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0780.png &
-
-python video.py --model_path for_video/saved_models/0790.pth --save_dir for_video/runs/0790 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0790.pth --save_dir for_video/runs/0790 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0790.pth --save_dir for_video/runs/0790 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0790.pth --save_dir for_video/runs/0790 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0790.pth --save_dir for_video/runs/0790 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0790.pth --save_dir for_video/runs/0790 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0780
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0790/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0790/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0790/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0790/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0790/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0790/run_6.npy 0790.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 790"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0790.png &
-
-python video.py --model_path for_video/saved_models/0800.pth --save_dir for_video/runs/0800 --filename run_1.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0800.pth --save_dir for_video/runs/0800 --filename run_2.npy --save_threshold -100   &
-python video.py --model_path for_video/saved_models/0800.pth --save_dir for_video/runs/0800 --filename run_3.npy --save_threshold -100 --invert_waypoints  &
-python video.py --model_path for_video/saved_models/0800.pth --save_dir for_video/runs/0800 --filename run_4.npy --save_threshold -100  --invert_colours &
-python video.py --model_path for_video/saved_models/0800.pth --save_dir for_video/runs/0800 --filename run_5.npy --save_threshold -100 --invert_waypoints --invert_colours &
-python video.py --model_path for_video/saved_models/0800.pth --save_dir for_video/runs/0800 --filename run_6.npy --save_threshold -100   &
-wait
-rm -rf for_video/runs/0790
-python /home/aritra/Documents/temp/youtube/rl_line_follower/demo/main.py /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0800/run_1.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0800/run_2.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0800/run_3.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0800/run_4.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0800/run_5.npy /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/runs/0800/run_6.npy 0800.mp4 /home/aritra/Documents/temp/youtube/rl_line_follower/demo/parts --episode_number "Episode 800"  --graph_path /home/aritra/Documents/temp/Learning_Reinforcement_Learning/line_follower_v0/for_video/graphs/0800.png &
-
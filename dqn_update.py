@@ -0,0 +1,72 @@
+import numpy as np
+import torch
+import torch.nn as nn
+
+# DQN gradient step with persistent input tensors. The replay buffer samples
+# straight into NumPy views of those tensors (see `buffers`), so no tensors
+# are allocated or converted per step. The target is computed without
+# building an autograd graph and fused into one addcmul. Plain MSE is the
+# weighted loss with all weights 1, so uniform and prioritized replay share
+# a single update function, which can optionally be torch.compile'd
+# (forward, target, loss and the generated backward graph).
+class DQNUpdater:
+    def __init__(self, policy_net, target_net, optimizer, gamma, batch_size, state_dim, compile=False, device="cpu"):
+        self.policy_net = policy_net
+        self.target_net = target_net
+        self.optimizer = optimizer
+        self.gamma = gamma
+        self.loss_fn = nn.MSELoss(reduction="none")
+
+        self.states = torch.zeros(batch_size, state_dim)
+        self.actions = torch.zeros(batch_size, 1, dtype=torch.int64)
+        self.rewards = torch.zeros(batch_size, 1)
+        self.next_states = torch.zeros(batch_size, state_dim)
+        self.dones = torch.zeros(batch_size, 1)
+        self.weights = torch.ones(batch_size, 1)
+        # NumPy views sharing memory with the tensors above, in ReplayBuffer.sample order
+        self.buffers = (
+            self.states.numpy(),
+            self.actions.numpy().reshape(-1),
+            self.rewards.numpy().reshape(-1),
+            self.next_states.numpy(),
+            self.dones.numpy().reshape(-1),
+        )
+        self.device = torch.device(device)
+        self.inputs = [
+            t.to(self.device)
+            for t in (self.states, self.actions, self.rewards, self.next_states, self.dones, self.weights)
+        ]
+
+        self.compute_loss = self._compute_loss
+        if compile:
+            self.compute_loss = torch.compile(self._compute_loss)
+
+    def _compute_loss(self, states, actions, rewards, next_states, dones, weights):
+        q_values = self.policy_net(states).gather(1, actions)
+        with torch.no_grad():
+            next_q_values = self.target_net(next_states).max(1, keepdim=True)[0]
+            expected_q_values = torch.addcmul(rewards, next_q_values, 1 - dones, value=self.gamma)
+        td_errors = q_values - expected_q_values
+        loss = (weights * self.loss_fn(q_values, expected_q_values)).mean()
+        return loss, td_errors
+
+    def load(self, batch):
+        # copy an already sampled batch (e.g. a slice of sample_many, or a
+        # prioritized sample whose 6th entry is the IS weights) into the buffers
+        for dst, src in zip(self.buffers, batch[:5]):
+            np.copyto(dst, src)
+        if len(batch) > 5:
+            np.copyto(self.weights.numpy().reshape(-1), batch[5])
+
+    def step(self, return_td_errors=False):
+        if self.device.type != "cpu":
+            for dst, src in zip(self.inputs, (self.states, self.actions, self.rewards, self.next_states, self.dones, self.weights)):
+                dst.copy_(src, non_blocking=True)
+        loss, td_errors = self.compute_loss(*self.inputs)
+
+        self.optimizer.zero_grad(set_to_none=True)
+        loss.backward()
+        self.optimizer.step()
+        if return_td_errors:
+            return loss.detach(), td_errors.detach().squeeze(1).cpu().numpy()
+        return loss.detach(), None
@@ -0,0 +1,160 @@
+import hashlib, json, os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import gymnasium as gym
+import numpy as np
+from tqdm import tqdm
+
+from atomic import atomic_write
+from evaluate import confidence_interval
+from numpy_policy import load_numpy_policy, policy_source
+
+# Evaluates every (checkpoint, condition) cell of a matrix on a process pool.
+# A condition is an (invert_waypoints, invert_colours) pair. Each worker keeps
+# one env per condition alive across cells, and every cell resets its env with
+# the same seed, so a cell's result does not depend on which worker ran it.
+# With a tolerance a cell stops after the first batch of episodes whose 95%
+# confidence interval is that narrow (episodes is then the maximum).
+
+CONDITIONS = [(False, False), (False, True), (True, False), (True, True)]
+
+RESULT_DTYPE = np.dtype([
+    ("episode", np.int64),           # training episode of the checkpoint
+    ("invert_waypoints", np.bool_),
+    ("invert_colours", np.bool_),
+    ("mean_reward", np.float64),
+    ("std_reward", np.float64),
+    ("ci_reward", np.float64),       # 95% confidence interval half-width of mean_reward
+    ("episodes_used", np.int64),
+])
+
+_envs = {}
+
+def env_config(artifact, condition):
+    invert_waypoints, invert_colours = condition
+    return dict(
+        sensor_grid=tuple(artifact["sensor_grid"]),
+        track=artifact["track"],
+        max_steps=artifact["max_steps"],
+        hitbox=artifact["hitbox"],
+        x_spacing=artifact["x_spacing"],
+        y_spacing=artifact["y_spacing"],
+        invert_waypoints=invert_waypoints,
+        invert_colours=invert_colours,
+    )
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# On-disk cache of cell results, one small JSON file per cell named by a hash of
+# the policy file actually loaded (numpy_policy.policy_source), the env config,
+# the episode count and the seed, so renamed or re-copied checkpoints still hit
+# and changed ones miss. Entries not looked up during a run can be evicted with
+# prune().
+class EvalCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.used = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, model_hash, env_name, config, episodes, seed, stopping=None):
+        spec = [model_hash, env_name, sorted(config.items()), episodes, seed]
+        if stopping is not None:
+            spec.append(stopping)  # (tolerance, batch_episodes) of early-stopped cells
+        return hashlib.sha256(json.dumps(spec).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        self.used.add(key)
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, entry):
+        self.used.add(key)
+        atomic_write(json.dumps(entry).encode(), self._path(key))
+
+    def prune(self):
+        # delete entries not looked up since this cache was opened
+        removed = 0
+        for name in os.listdir(self.directory):
+            if name.endswith(".json") and name[:-5] not in self.used:
+                os.remove(os.path.join(self.directory, name))
+                removed += 1
+        return removed
+
+def _worker_init():
+    import line_follower_v0  # registers the env in the worker
+
+def _get_env(env_name, env_kwargs):
+    key = (env_name, tuple(sorted(env_kwargs.items())))
+    if key not in _envs:
+        _envs[key] = gym.make(f'my_gym_envs/{env_name}', render_mode=None, **env_kwargs)
+    return _envs[key]
+
+def evaluate_cell(model_path, condition, env_name, episodes, seed, tolerance=None, batch_episodes=20):
+    policy, artifact = load_numpy_policy(model_path)
+    env = _get_env(env_name, env_config(artifact, condition))
+
+    total_rewards = np.zeros(episodes)
+    state, _ = env.reset(seed=seed)
+    for ep in range(episodes):
+        if ep > 0:
+            state, _ = env.reset()
+        done = False
+        while not done:
+            action = policy.act(state)
+            state, reward, terminated, truncated, _ = env.step(action)
+            total_rewards[ep] += reward
+            done = terminated or truncated
+        if tolerance is not None and (ep + 1) % batch_episodes == 0 and confidence_interval(total_rewards[:ep+1]) <= tolerance:
+            total_rewards = total_rewards[:ep+1]
+            break
+    return (artifact["episode"], float(total_rewards.mean()), float(total_rewards.std()),
+            confidence_interval(total_rewards), len(total_rewards))
+
+def evaluate_matrix(model_paths, conditions=CONDITIONS, env_name="line_follower_v0", episodes=100, seed=23, max_workers=None, cache=None,
+                    tolerance=None, batch_episodes=20):
+    # one RESULT_DTYPE row per (checkpoint, condition), in model_paths x conditions order;
+    # with an EvalCache only the cells missing from it are evaluated
+    stopping = None if tolerance is None else [tolerance, batch_episodes]
+    cells = [(path, condition) for path in model_paths for condition in conditions]
+    results = np.zeros(len(cells), dtype=RESULT_DTYPE)
+    keys = [None] * len(cells)
+    todo = []
+    if cache is not None:
+        for m, path in enumerate(model_paths):
+            model_hash = file_hash(policy_source(path))  # the file evaluate_cell will load
+            _, artifact = load_numpy_policy(path)
+            for c, condition in enumerate(conditions):
+                i = m * len(conditions) + c
+                keys[i] = cache.key(model_hash, env_name, env_config(artifact, condition), episodes, seed, stopping)
+                entry = cache.get(keys[i])
+                if entry is None or "ci_reward" not in entry:
+                    todo.append(i)
+                else:
+                    results[i] = (entry["episode"], *condition, entry["mean_reward"], entry["std_reward"], entry["ci_reward"], entry["episodes_used"])
+    else:
+        todo = list(range(len(cells)))
+    if not todo:
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), initializer=_worker_init) as pool:
+        futures = {
+            pool.submit(evaluate_cell, *cells[i], env_name, episodes, seed, tolerance, batch_episodes): i
+            for i in todo
+        }
+        for future in tqdm(as_completed(futures), total=len(futures)):
+            i = futures[future]
+            episode, mean_reward, std_reward, ci_reward, episodes_used = future.result()
+            results[i] = (episode, *cells[i][1], mean_reward, std_reward, ci_reward, episodes_used)
+            if cache is not None:
+                cache.put(keys[i], dict(episode=episode, mean_reward=mean_reward, std_reward=std_reward, ci_reward=ci_reward, episodes_used=episodes_used))
+    return results
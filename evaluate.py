@@ -1,8 +1,31 @@
+import math
 import gymnasium as gym
-import torch
-import torch.nn as nn
-from models import DQN
 import numpy as np
+from statistics import NormalDist
+
+from numpy_policy import greedy_actions
+
+def t_quantile(p, df):
+    # Student-t quantile without scipy: exact for 1 and 2 degrees of freedom,
+    # the Cornish-Fisher expansion around the normal quantile beyond (within
+    # 1% of the exact value for 95% and 99% intervals from df=3)
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    return (z + (z**3 + z) / (4 * df) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+            + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+            + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * df**4))
+
+def confidence_interval(rewards, confidence=0.95):
+    # half-width of the Student-t interval around the mean reward; the normal
+    # z would be too narrow for the 20-odd episodes of a sequential evaluation
+    rewards = np.asarray(rewards, dtype=float)
+    if len(rewards) < 2:
+        return float("inf")
+    t = t_quantile((1 + confidence) / 2, len(rewards) - 1)
+    return float(t * rewards.std(ddof=1) / np.sqrt(len(rewards)))
 
 def evaluate_model(
     model, env_name, render_mode,
@@ -13,52 +36,99 @@ def evaluate_model(
     x_spacing,
     y_spacing,
     episodes,
-    verbose=False
+    verbose=False,
+    num_envs=16,
+    return_episode_rewards=False,
+    tolerance=None,
+    batch_episodes=20,
+    confidence=0.95
 ):
-    env = gym.make(
-        f'my_gym_envs/{env_name}', render_mode=render_mode,
-        sensor_grid=sensor_grid,
-        track=track,
-        max_steps=max_steps,
-        hitbox=hitbox,
-        x_spacing=x_spacing,
-        y_spacing=y_spacing,
-        verbose=verbose
-    )
+    # Steps up to num_envs env copies in lockstep with one forward per step over
+    # the still-active ones; an env that finishes starts the next pending episode.
+    # With a tolerance, episodes is the maximum: whole batches of batch_episodes
+    # are run until the confidence interval's half-width is at most tolerance.
+    # Only complete batches count, so episodes that end early are not
+    # over-represented.
+    # Returns the mean reward; (mean, per-episode rewards) with
+    # return_episode_rewards; (mean, half-width, episodes used) with a tolerance.
+    if tolerance is not None and return_episode_rewards:
+        raise ValueError("return_episode_rewards cannot be combined with tolerance")
+    if render_mode == "human":
+        num_envs = 1  # one window, episodes shown one after another
+    num_envs = max(1, min(num_envs, episodes if tolerance is None else batch_episodes))
+    envs = [
+        gym.make(
+            f'my_gym_envs/{env_name}', render_mode=render_mode,
+            sensor_grid=sensor_grid,
+            track=track,
+            max_steps=max_steps,
+            hitbox=hitbox,
+            x_spacing=x_spacing,
+            y_spacing=y_spacing,
+            verbose=verbose
+        )
+        for _ in range(num_envs)
+    ]
     # env.metadata["render_fps"] = 5
-    
+
     total_rewards = []
-    for ep in range(episodes):
-        state, _ = env.reset()
-        done = False
-        total_reward = 0
 
-        while not done:
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                q_values = model(state_tensor)
-                action = q_values.argmax().item()
+    def run(n):
+        # n more episodes, appended to total_rewards
+        if n <= 0:
+            return
+        k = min(n, num_envs)
+        states = np.stack([env.reset()[0] for env in envs[:k]]).astype(np.float32)
+        running_rewards = np.zeros(k)
+        active = np.ones(k, dtype=bool)
+        started = k
+        while active.any():
+            idx = np.flatnonzero(active)
+            actions = greedy_actions(model, states[idx])
 
-            next_state, reward, terminated, truncated, _ = env.step(action)
-            state = next_state
-            total_reward += reward
-            done = terminated or truncated
+            for i, action in zip(idx, actions):
+                next_state, reward, terminated, truncated, _ = envs[i].step(action)
+                states[i] = next_state
+                running_rewards[i] += reward
+                if terminated or truncated:
+                    total_rewards.append(float(running_rewards[i]))
+                    if verbose: print(f"Episode {len(total_rewards)}: Total Reward = {running_rewards[i]}")
+                    running_rewards[i] = 0
+                    if started < n:
+                        states[i] = envs[i].reset()[0]
+                        started += 1
+                    else:
+                        active[i] = False
 
-        total_rewards.append(total_reward)
-        if verbose: print(f"Episode {ep+1}: Total Reward = {total_reward}")
+    if tolerance is None:
+        run(episodes)
+    else:
+        half_width = float("inf")
+        while len(total_rewards) < episodes:
+            run(min(batch_episodes, episodes - len(total_rewards)))
+            half_width = confidence_interval(total_rewards, confidence)
+            if half_width <= tolerance:
+                break
 
-    env.close()
+    for env in envs:
+        env.close()
+    if tolerance is not None:
+        return np.mean(total_rewards), half_width, len(total_rewards)
+    if return_episode_rewards:
+        return np.mean(total_rewards), np.array(total_rewards)
     return np.mean(total_rewards)
 
 if __name__ == "__main__":
     import line_follower_v0
     ENV_NAME = "line_follower_v0"
     MODEL_PATH = "dqn_linefollower.pth"
+    USE_Q_TABLE = True  # act from a precomputed Q-table instead of a forward per step
 
     import os
     assert os.path.exists(MODEL_PATH), f"Model file not found: {MODEL_PATH}"
 
-    loaded_model = torch.load(MODEL_PATH, map_location=torch.device('cpu'), weights_only=False)
+    from numpy_policy import load_numpy_policy
+    policy_net, loaded_model = load_numpy_policy(MODEL_PATH)
     sensor_grid = loaded_model["sensor_grid"]
     hitbox = loaded_model["hitbox"]
 
@@ -67,18 +137,14 @@ if __name__ == "__main__":
     track = loaded_model["track"]
     # track = "rounded_square"
 
-    policy_net = DQN(
-        sensor_grid[0]*sensor_grid[1],
-        loaded_model["action_dim"],
-        loaded_model["hidden_dim"],
-        loaded_model["hidden_layers"]
-    )
-    policy_net.load_state_dict(loaded_model["state_dict"])
-    policy_net.eval()
+    policy = policy_net
+    if USE_Q_TABLE:
+        from qtable import QTable
+        policy = QTable(policy_net, sensor_grid[0]*sensor_grid[1])
 
     for run in range(10):
         avg_reward = evaluate_model(
-            policy_net,
+            policy,
             ENV_NAME,
             "human",
             sensor_grid,
@@ -90,3 +156,4 @@ if __name__ == "__main__":
             episodes=1,
             verbose=True
         )
+    if USE_Q_TABLE: print(policy.stats())
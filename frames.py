@@ -0,0 +1,291 @@
+import io, os
+import numpy as np
+
+# Streams rendered frames of a run straight into a .npy file on disk instead
+# of collecting them in a list. The file is a memory map preallocated for
+# `capacity` frames and grown in chunks if needed; close() rewrites the header
+# with the real frame count and truncates the unused tail, discard() deletes
+# it. Frames go to a temporary file that only replaces `path` on close(), so
+# a discarded run never clobbers an earlier one.
+
+HEADER_SIZE = 128  # fixed, so the header can be rewritten in place whatever the frame count
+
+def _npy_header(dtype, shape):
+    header = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": tuple(shape)})
+    header = header.encode("latin1").ljust(HEADER_SIZE - 10 - 1) + b"\n"
+    return np.lib.format.MAGIC_PREFIX + bytes([1, 0]) + len(header).to_bytes(2, "little") + header
+
+class NpyFrameWriter:
+    def __init__(self, path, capacity=256, grow_by=256):
+        self.path = path
+        self.tmp_path = path + ".partial"
+        self.capacity = capacity
+        self.grow_by = grow_by
+        self.count = 0
+        self.frames = None
+        self.file = None
+
+    def _map(self):
+        self.frames = np.memmap(self.file, dtype=self.dtype, mode="r+", offset=HEADER_SIZE, shape=(self.capacity, *self.frame_shape))
+
+    def _resize(self, frames):
+        self.file.truncate(HEADER_SIZE + frames * self.frame_bytes)
+
+    def append(self, frame):
+        frame = np.asarray(frame)
+        if self.file is None:
+            self.dtype, self.frame_shape = frame.dtype, frame.shape
+            self.frame_bytes = frame.nbytes
+            self.file = open(self.tmp_path, "w+b")
+            self.file.write(_npy_header(self.dtype, (self.capacity, *self.frame_shape)))
+            self._resize(self.capacity)
+            self._map()
+        elif self.count == self.capacity:
+            self.frames.flush()
+            self.frames = None
+            self.capacity += self.grow_by
+            self._resize(self.capacity)
+            self._map()
+        self.frames[self.count] = frame
+        self.count += 1
+
+    def close(self):
+        # finish the file with exactly `count` frames and move it to `path`
+        if self.file is None:
+            return
+        self.frames.flush()
+        self.frames = None
+        self.file.seek(0)
+        self.file.write(_npy_header(self.dtype, (self.count, *self.frame_shape)))
+        self._resize(self.count)
+        self.file.close()
+        self.file = None
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        if self.file is None:
+            return
+        self.frames = None
+        self.file.close()
+        self.file = None
+        os.remove(self.tmp_path)
+
+# Compact recording format (.lfr) for the line-follower scenes, which have a
+# handful of colours and change little from step to step. Frames are stored as
+# indices into a palette of at most 256 colours: the first frame of every
+# chunk as runs of equal indices, the others as the runs of pixels that
+# changed since the previous frame. Each chunk of frames is appended to the
+# file as soon as it is full, as an .npz prefixed by its size and frame count,
+# so the reader can seek to any chunk and decode frame by frame from there.
+
+COMPACT_MAGIC = b"LFRUN\x01"
+
+def _runs(positions):
+    # (starts, lengths) of the runs of consecutive values in sorted positions
+    if len(positions) == 0:
+        return positions, positions
+    first = np.concatenate(([0], np.flatnonzero(np.diff(positions) != 1) + 1))
+    return positions[first], np.diff(np.append(first, len(positions)))
+
+class CompactFrameWriter:
+    def __init__(self, path, chunk_frames=64):
+        self.path = path
+        self.tmp_path = path + ".partial"
+        self.chunk_frames = chunk_frames
+        self.count = 0
+        self.file = None
+        self.palette = np.zeros((0, 3), dtype=np.uint8)
+        self.palette_keys = np.zeros(0, dtype=np.uint32)  # sorted packed RGB
+        self.palette_index = np.zeros(0, dtype=np.uint8)  # palette index of each sorted key
+        self.prev = None
+        self.idx = None
+        self._reset_chunk()
+
+    def _reset_chunk(self):
+        self.kinds, self.n_runs, self.n_values = [], [], []
+        self.run_starts, self.run_lengths, self.values = [], [], []
+
+    def _indices(self, pixels):
+        # palette indices of (N, 3) RGB pixels, adding unseen colours
+        keys = (pixels[:, 0].astype(np.uint32) << 16) | (pixels[:, 1].astype(np.uint32) << 8) | pixels[:, 2]
+        unique, inverse = np.unique(keys, return_inverse=True)
+        known = np.isin(unique, self.palette_keys)
+        if not known.all():
+            new = unique[~known]
+            if len(self.palette) + len(new) > 256:
+                self.discard()
+                raise ValueError("more than 256 colours in the recording, use the .npy format")
+            new_index = np.arange(len(self.palette), len(self.palette) + len(new), dtype=np.uint8)
+            self.palette = np.concatenate([self.palette, np.stack([new >> 16, (new >> 8) & 255, new & 255], 1).astype(np.uint8)])
+            keys_all = np.concatenate([self.palette_keys, new])
+            order = np.argsort(keys_all)
+            self.palette_keys = keys_all[order]
+            self.palette_index = np.concatenate([self.palette_index, new_index])[order]
+        return self.palette_index[np.searchsorted(self.palette_keys, unique)][inverse]
+
+    def _changed(self, frame):
+        # sorted flat positions of the pixels that changed since the previous
+        # frame; rows are compared in 8-byte words first so only rows that
+        # differ are checked pixel by pixel
+        rows = frame.reshape(frame.shape[0], -1)
+        prev_rows = self.prev.reshape(frame.shape[0], -1)
+        word = np.uint64 if rows.shape[1] % 8 == 0 else np.uint8
+        changed_rows = np.flatnonzero((rows.view(word) != prev_rows.view(word)).any(1))
+        differs = frame[changed_rows] != self.prev[changed_rows]
+        row, col = np.nonzero(differs[..., 0] | differs[..., 1] | differs[..., 2])
+        return changed_rows[row] * frame.shape[1] + col
+
+    def append(self, frame):
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if self.file is None:
+            self.frame_shape = frame.shape
+            self.file = open(self.tmp_path, "wb")
+            self.file.write(COMPACT_MAGIC)
+        pixels = frame.reshape(-1, 3)
+        # palette index image of the current frame, updated only where pixels changed
+        if self.prev is None:
+            self.idx = self._indices(pixels)
+        else:
+            changed = self._changed(frame)
+            changed_values = self._indices(pixels[changed])
+            self.idx[changed] = changed_values
+        if not self.kinds:
+            # key frame: runs of equal palette indices
+            starts = np.concatenate(([0], np.flatnonzero(self.idx[1:] != self.idx[:-1]) + 1))
+            self.kinds.append(0)
+            self.run_starts.append(starts.astype(np.uint32))
+            self.run_lengths.append(np.diff(np.append(starts, len(self.idx))).astype(np.uint32))
+            self.values.append(self.idx[starts])
+        else:
+            # delta frame: runs of changed pixels and their new indices
+            starts, lengths = _runs(changed)
+            self.kinds.append(1)
+            self.run_starts.append(starts.astype(np.uint32))
+            self.run_lengths.append(lengths.astype(np.uint32))
+            self.values.append(changed_values)
+        self.n_runs.append(len(self.run_starts[-1]))
+        self.n_values.append(len(self.values[-1]))
+        self.prev = frame
+        self.count += 1
+        if len(self.kinds) == self.chunk_frames:
+            self._write_chunk()
+
+    def _write_chunk(self):
+        if not self.kinds:
+            return
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            palette=self.palette,
+            frame_shape=np.array(self.frame_shape),
+            kinds=np.array(self.kinds, dtype=np.uint8),
+            n_runs=np.array(self.n_runs, dtype=np.int64),
+            n_values=np.array(self.n_values, dtype=np.int64),
+            run_starts=np.concatenate(self.run_starts),
+            run_lengths=np.concatenate(self.run_lengths),
+            values=np.concatenate(self.values),
+        )
+        data = buffer.getvalue()
+        self.file.write(len(data).to_bytes(8, "little") + len(self.kinds).to_bytes(4, "little"))
+        self.file.write(data)
+        self._reset_chunk()
+
+    def close(self):
+        if self.file is None:
+            return
+        self._write_chunk()
+        self.file.close()
+        self.file = None
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        os.remove(self.tmp_path)
+
+class CompactFrameReader:
+    # Lazy reader for .lfr files: len(), iteration and indexing yield (H, W, 3)
+    # uint8 frames; only the chunk holding the requested frame is read.
+    def __init__(self, path):
+        self.path = path
+        self.offsets = []
+        self.chunk_starts = [0]
+        with open(path, "rb") as f:
+            assert f.read(len(COMPACT_MAGIC)) == COMPACT_MAGIC, f"not a compact run file: {path}"
+            while prefix := f.read(12):
+                size, frames = int.from_bytes(prefix[:8], "little"), int.from_bytes(prefix[8:], "little")
+                self.offsets.append((f.tell(), size))
+                self.chunk_starts.append(self.chunk_starts[-1] + frames)
+                f.seek(size, os.SEEK_CUR)
+        self._chunk = None
+        self._chunk_index = None
+        self._cursor = None  # (next frame index, decoder positioned on it) for sequential indexing
+        self.frame_shape = tuple(int(n) for n in self._load_chunk(0)["frame_shape"]) if self.offsets else (0, 0, 3)
+
+    def __len__(self):
+        return self.chunk_starts[-1]
+
+    @property
+    def shape(self):
+        return (len(self), *self.frame_shape)
+
+    def _load_chunk(self, c):
+        if self._chunk_index != c:
+            offset, size = self.offsets[c]
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                with np.load(io.BytesIO(f.read(size))) as data:
+                    self._chunk = {k: data[k] for k in data.files}
+            self._chunk_index = c
+        return self._chunk
+
+    def _decode_chunk(self, c, start=0):
+        # yields the frames of chunk c from position `start` on
+        chunk = self._load_chunk(c)
+        run_ends = np.cumsum(chunk["n_runs"])
+        value_ends = np.cumsum(chunk["n_values"])
+        palette = chunk["palette"]
+        for i, kind in enumerate(chunk["kinds"]):
+            runs = slice(run_ends[i] - chunk["n_runs"][i], run_ends[i])
+            values = chunk["values"][value_ends[i] - chunk["n_values"][i]:value_ends[i]]
+            starts, lengths = chunk["run_starts"][runs].astype(np.int64), chunk["run_lengths"][runs].astype(np.int64)
+            if kind == 0:
+                idx = np.repeat(values, lengths)
+            else:
+                offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+                idx[offsets + np.arange(len(values))] = values
+            if i >= start:
+                yield np.take(palette, idx, axis=0).reshape(self.frame_shape)
+
+    def __iter__(self):
+        for c in range(len(self.offsets)):
+            yield from self._decode_chunk(c)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        c = int(np.searchsorted(self.chunk_starts, i, side="right")) - 1
+        if self._cursor is not None and self._cursor[0] == i and self._chunk_index == c:
+            decoder = self._cursor[1]
+        else:
+            decoder = self._decode_chunk(c, i - self.chunk_starts[c])
+        frame = next(decoder)
+        self._cursor = (i + 1, decoder) if i + 1 < self.chunk_starts[c + 1] else None
+        return frame
+
+def frame_writer(path, capacity=256):
+    # writer for `path` by extension: .lfr compact format, anything else .npy
+    if path.endswith(".lfr"):
+        return CompactFrameWriter(path)
+    return NpyFrameWriter(path, capacity=capacity)
+
+def read_frames(path):
+    # frames of a recorded run without loading it whole: a memory-mapped array
+    # for .npy, a lazy CompactFrameReader for .lfr
+    if path.endswith(".lfr"):
+        return CompactFrameReader(path)
+    return np.load(path, mmap_mode="r")
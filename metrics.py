@@ -0,0 +1,69 @@
+import json, os, subprocess, sys
+from collections import deque
+
+# Trailing mean over the last `window` values, updated in O(1) per value.
+class RunningMean:
+    def __init__(self, window=100):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+
+    def update(self, value):
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+        return self.mean()
+
+    def mean(self):
+        return self.total / len(self.values) if self.values else None
+
+# Append-only JSON-lines metrics stream. Every record is one line, written as
+# it happens, so the cost per episode is constant and a crash loses at most
+# the line being written.
+class MetricsLogger:
+    def __init__(self, path, append=False):
+        self.path = path
+        self.file = open(path, "a" if append else "w", buffering=1)
+
+    def log(self, kind, **fields):
+        self.file.write(json.dumps({"type": kind, **fields}) + "\n")
+
+    def close(self):
+        self.file.close()
+
+def read_metrics(path, upto_episode=None):
+    metrics = {
+        "episodes": [], "rewards": [], "smoothed": [], "epsilons": [], "losses": [],
+        "test_episodes": [], "test_rewards": [],
+    }
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partially written last line
+            if upto_episode is not None and record.get("episode", 0) > upto_episode:
+                continue
+            if record["type"] == "episode":
+                metrics["episodes"].append(record["episode"])
+                metrics["rewards"].append(record["reward"])
+                metrics["smoothed"].append(record["smoothed"])
+                metrics["epsilons"].append(record["epsilon"])
+                metrics["losses"].append(record.get("loss"))
+            elif record["type"] == "test":
+                metrics["test_episodes"].append(record["episode"])
+                metrics["test_rewards"].append(record["reward"])
+    return metrics
+
+def launch_plot(metrics_path, output_path, upto_episode=None, dpi=None, title=None):
+    # render the reward plot in a separate process so the training loop never touches matplotlib
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plot_rewards.py")
+    cmd = [sys.executable, script, metrics_path, output_path]
+    if upto_episode is not None:
+        cmd += ["--upto_episode", str(upto_episode)]
+    if dpi is not None:
+        cmd += ["--dpi", str(dpi)]
+    if title is not None:
+        cmd += ["--title", title]
+    return subprocess.Popen(cmd)
@@ -0,0 +1,68 @@
+import os
+import numpy as np
+
+# Forward pass of models.DQN (Linear layers with ReLU in between) in plain
+# NumPy, for evaluation and video workers that would otherwise import torch
+# just to run the policy. Weights come from the .npz policy artifact that
+# training writes next to every .pth.
+
+def read_policy_npz(path):
+    # artifact dict as saved by checkpoint.policy_to_npz, with NumPy weights
+    with np.load(path) as data:
+        arrays = {k: data[k] for k in data.files}
+    artifact = {k: (v.item() if v.ndim == 0 else tuple(v.tolist())) for k, v in arrays.items() if not k.startswith("state_dict.")}
+    artifact["state_dict"] = {k[len("state_dict."):]: v for k, v in arrays.items() if k.startswith("state_dict.")}
+    return artifact
+
+def _layer_index(layer):
+    # "net" (hidden_layers=0), "net.0.linear" (hidden), "net.2" (output)
+    parts = layer.split(".")
+    return int(parts[1]) if len(parts) > 1 else 0
+
+class NumpyPolicy:
+    def __init__(self, state_dict):
+        layers = sorted({name.rsplit(".", 1)[0] for name in state_dict}, key=_layer_index)
+        self.weights = [np.ascontiguousarray(np.asarray(state_dict[f"{l}.weight"], dtype=np.float32).T) for l in layers]
+        self.biases = [np.asarray(state_dict[f"{l}.bias"], dtype=np.float32) for l in layers]
+
+    def q_values(self, states):
+        x = np.asarray(states, dtype=np.float32)
+        for w, b in zip(self.weights[:-1], self.biases[:-1]):
+            x = np.maximum(x @ w + b, 0)
+        return x @ self.weights[-1] + self.biases[-1]
+
+    def act_batch(self, states):
+        return self.q_values(states).argmax(1)
+
+    def act(self, state):
+        return int(self.q_values(np.asarray(state)[None])[0].argmax())
+
+def greedy_actions(model, states):
+    # argmax actions for a batch of states from anything acting as a policy:
+    # an object with act_batch (NumpyPolicy, qtable.QTable) or a torch DQN
+    if hasattr(model, "act_batch"):
+        return model.act_batch(states)
+    import torch
+    with torch.no_grad():
+        return model(torch.as_tensor(states, dtype=torch.float32)).argmax(1).numpy()
+
+def policy_source(path):
+    # the file load_numpy_policy reads for `path`: its .npz twin when there is
+    # one written no earlier than the .pth (training saves the .pth first, so
+    # an older .npz is left over from a different run), otherwise path itself
+    npz_path = os.path.splitext(path)[0] + ".npz"
+    if npz_path == path or (os.path.exists(npz_path) and os.path.getmtime(npz_path) >= os.path.getmtime(path)):
+        return npz_path
+    return path
+
+def load_numpy_policy(path):
+    # (NumpyPolicy, artifact). A .pth is read through its .npz twin when that
+    # is current (see policy_source), so torch is only imported otherwise.
+    source = policy_source(path)
+    if source.endswith(".npz"):
+        artifact = read_policy_npz(source)
+    else:
+        from checkpoint import load_policy
+        _, artifact = load_policy(path)
+        artifact["state_dict"] = {k: v.numpy() for k, v in artifact["state_dict"].items()}
+    return NumpyPolicy(artifact["state_dict"]), artifact
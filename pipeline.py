@@ -0,0 +1,153 @@
+import argparse, os, shutil, subprocess, sys, time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Renders the video parts for every saved model. Per checkpoint the DAG is
+#   rollouts (one video.py run of the 6 inversion variants) -> composite -> cleanup
+# and all jobs of all checkpoints share one bounded worker pool. Jobs whose
+# outputs already exist are skipped, so an interrupted render resumes where it
+# stopped. Downstream jobs are preferred over starting new checkpoints, and a
+# checkpoint's rollouts wait until the runs `max_inflight` checkpoints back
+# have been cleaned up, which bounds the frames kept on disk.
+
+# (invert_waypoints, invert_colours) of run_1 ... run_6
+VARIANTS = [(True, True), (False, False), (True, False), (False, True), (True, True), (False, False)]
+
+class Job:
+    def __init__(self, name, stage, action, outputs=(), deps=(), after=(), priority=0, cwd=None):
+        self.name = name
+        self.stage = stage
+        self.action = action      # callable, or a command list run as a subprocess
+        self.outputs = outputs    # job is skipped if all of these exist
+        self.deps = deps          # jobs that must succeed first
+        self.after = after        # jobs that must only have finished (in any state) first
+        self.priority = priority  # lower runs first among ready jobs
+        self.cwd = cwd
+        self.state = "pending"
+
+    def ready(self, jobs):
+        return (all(jobs[d].state in ("done", "skipped") for d in self.deps)
+                and all(d not in jobs or jobs[d].state in ("done", "skipped", "failed") for d in self.after))
+
+    def blocked(self, jobs):
+        return any(jobs[d].state == "failed" for d in self.deps)
+
+    def run(self):
+        start = time.perf_counter()
+        if callable(self.action):
+            self.action()
+        else:
+            subprocess.run(self.action, check=True, stdout=subprocess.DEVNULL, cwd=self.cwd)
+        missing = [p for p in self.outputs if not os.path.exists(p)]
+        if missing:
+            raise RuntimeError(f"{self.name} did not produce {missing}")
+        return time.perf_counter() - start
+
+def run_jobs(job_list, workers):
+    # runs the jobs on `workers` threads (each job is mostly a subprocess);
+    # returns per-stage wall times of the jobs run and per-stage state counts
+    jobs = {job.name: job for job in job_list}
+    timings = defaultdict(list)
+    counts = defaultdict(lambda: defaultdict(int))
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            # settle failures and skips, which can make further jobs ready
+            settled = False
+            while not settled:
+                settled = True
+                for job in jobs.values():
+                    if job.state != "pending":
+                        continue
+                    if job.blocked(jobs):
+                        job.state = "failed"
+                        counts[job.stage]["blocked"] += 1
+                        settled = False
+                    elif job.ready(jobs) and job.outputs and all(os.path.exists(p) for p in job.outputs):
+                        job.state = "skipped"
+                        counts[job.stage]["skipped"] += 1
+                        settled = False
+
+            ready = sorted((j for j in jobs.values() if j.state == "pending" and j.ready(jobs)), key=lambda j: j.priority)
+            for job in ready[:workers - len(running)]:
+                job.state = "running"
+                running[pool.submit(job.run)] = job
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job = running.pop(future)
+                try:
+                    timings[job.stage].append(future.result())
+                    job.state = "done"
+                    counts[job.stage]["done"] += 1
+                except Exception as e:
+                    job.state = "failed"
+                    counts[job.stage]["failed"] += 1
+                    print(f"{job.name} failed: {e}", file=sys.stderr)
+    return timings, counts
+
+def report(timings, counts):
+    print(f"{'stage':<10} {'done':>5} {'skipped':>8} {'failed':>7} {'total s':>9} {'mean s':>8}")
+    for stage in counts:
+        t = timings[stage]
+        c = counts[stage]
+        mean = sum(t) / len(t) if t else 0.0
+        print(f"{stage:<10} {c['done']:>5} {c['skipped']:>8} {c['failed'] + c['blocked']:>7} {sum(t):>9.1f} {mean:>8.2f}")
+
+def build_jobs(args):
+    checkpoints = [f"{i:04d}" for i in range(args.start, args.end + 1, args.step)]
+    checkpoints = [c for c in checkpoints if os.path.exists(os.path.join(args.models_dir, f"{c}.pth"))]
+    ext = ".lfr" if args.compact else ".npy"
+    jobs = []
+    for k, c in enumerate(checkpoints):
+        run_dir = os.path.join(args.runs_dir, c)
+        runs = [os.path.join(run_dir, f"run_{j+1}{ext}") for j in range(len(VARIANTS))]
+        video = os.path.join(args.video_dir, f"{c}.mp4")
+        if args.compositor is not None and os.path.exists(video):
+            continue  # finished in an earlier run
+
+        after = [f"cleanup {checkpoints[k - args.max_inflight]}"] if k >= args.max_inflight else []
+        # all variants of a checkpoint in one video.py process (one model load, batched forwards)
+        cmd = [
+            sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "video.py"),
+            "--model_path", os.path.join(args.models_dir, f"{c}.pth"),
+            "--save_dir", run_dir,
+            "--save_threshold", str(args.save_threshold),
+            "--variants", *(f"{int(invert_waypoints)}{int(invert_colours)}" for invert_waypoints, invert_colours in VARIANTS),
+        ]
+        cmd += ["--compact"] * args.compact
+        jobs.append(Job(f"rollout {c}", "rollout", cmd, outputs=runs, after=after, priority=(2, k)))
+
+        if args.compositor is None:
+            continue
+        cmd = [sys.executable, os.path.abspath(args.compositor), *map(os.path.abspath, runs), f"{c}.mp4", os.path.abspath(args.parts_dir),
+               "--episode_number", f"Episode {int(c)}", "--graph_path", os.path.abspath(os.path.join(args.graphs_dir, f"{c}.png"))]
+        jobs.append(Job(f"composite {c}", "composite", cmd, outputs=[video], deps=[f"rollout {c}"], priority=(1, k), cwd=args.video_dir))
+        if not args.keep_runs:
+            jobs.append(Job(f"cleanup {c}", "cleanup", lambda d=run_dir: shutil.rmtree(d, ignore_errors=True), deps=[f"composite {c}"], priority=(0, k)))
+    return jobs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render rollouts and composite the video part of every saved model.")
+    parser.add_argument("--start", type=int, default=50, help="First checkpoint (episode number).")
+    parser.add_argument("--end", type=int, default=800, help="Last checkpoint (inclusive).")
+    parser.add_argument("--step", type=int, default=10, help="Episodes between checkpoints.")
+    parser.add_argument("--models_dir", type=str, default="for_video/saved_models")
+    parser.add_argument("--runs_dir", type=str, default="for_video/runs")
+    parser.add_argument("--graphs_dir", type=str, default="for_video/graphs")
+    parser.add_argument("--compositor", type=str, default=None, help="Path to the compositor's main.py; without it only the rollouts are rendered.")
+    parser.add_argument("--parts_dir", type=str, default="parts", help="Compositor assets directory.")
+    parser.add_argument("--video_dir", type=str, default=".", help="Where the compositor writes NNNN.mp4 (its working directory).")
+    parser.add_argument("--save_threshold", type=float, default=-100)
+    parser.add_argument("--compact", action="store_true", help="Record runs in the compact .lfr format.")
+    parser.add_argument("--keep_runs", action="store_true", help="Keep for_video/runs/NNNN after compositing.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Jobs running at once.")
+    parser.add_argument("--max_inflight", type=int, default=None, help="Checkpoints whose runs may exist at once (default: enough to keep the workers busy).")
+    args = parser.parse_args()
+    if args.max_inflight is None:
+        args.max_inflight = args.workers + 1
+
+    timings, counts = run_jobs(build_jobs(args), args.workers)
+    report(timings, counts)
@@ -1,56 +1,49 @@
-import os
-import torch
+import argparse, os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from tqdm import tqdm, trange
-
-model_names = [a[:-4] for a in os.listdir("for_video/saved_models/") if a.endswith(".pth")]
-
-model_names.sort(key=int)
-
-for it in tqdm(model_names):
-    file_path = f"for_video/saved_models/{it}.pth"
-    loaded = torch.load(file_path, weights_only=False)
-    rewards_per_episode = loaded["rewards_per_episode"]
-    test_episodes = loaded["test_episodes"]
-    test_rewards = loaded["test_rewards"]
-    episode = loaded["episode"]
-    
-    
-
-    # make a plot
-    window = 100
-    if len(rewards_per_episode) >= window:
-        # Pad the rewards array on both sides with terminal elements
-        left_pad = window // 2
-        right_pad = window - 1 - left_pad
-        padded_rewards = np.concatenate([
-            np.full(left_pad, rewards_per_episode[0]),
-            rewards_per_episode,
-            np.full(right_pad, rewards_per_episode[-1])
-        ])
-        smoothed = np.convolve(padded_rewards, np.ones(window)/window, mode='valid')
-    else:
-        smoothed = rewards_per_episode  # Not enough data for smoothing
-    
-    
-    
-    
-    
-    
+from tqdm import tqdm
+
+# Renders the learning-curve frame for every saved model, for the video. All
+# frames are prefixes of the same history, so it is read once (from the final
+# training state or the metrics log) and each worker draws its frames into one
+# reused figure, only replacing the line data between frames.
+
+WINDOW = 100
+
+_history = None
+_figure = None
+
+def load_history(path):
+    if path.endswith(".jsonl"):
+        from metrics import read_metrics
+        metrics = read_metrics(path)
+        return np.asarray(metrics["rewards"]), np.asarray(metrics["test_episodes"]), np.asarray(metrics["test_rewards"])
+    import torch
+    state = torch.load(path, weights_only=False)
+    return np.asarray(state["rewards_per_episode"]), np.asarray(state["test_episodes"]), np.asarray(state["test_rewards"], dtype=float)
+
+def smooth(rewards, window=WINDOW):
+    if len(rewards) < window:
+        return rewards  # Not enough data for smoothing
+    # centered moving average, padded on both sides with the terminal elements
+    left_pad = window // 2
+    right_pad = window - 1 - left_pad
+    padded = np.concatenate([np.full(left_pad, rewards[0]), rewards, np.full(right_pad, rewards[-1])])
+    cumsum = np.concatenate([[0.0], np.cumsum(padded)])
+    return (cumsum[window:] - cumsum[:-window]) / window
+
+def _make_figure():
     # Set the style to dark_background
     plt.style.use('dark_background')
-
-    # Create the plot
     fig, ax = plt.subplots()
 
-    x_range = range(len(rewards_per_episode))
-    x_range_smoothed = range(len(smoothed))
-
     # Plot the data with dark-mode friendly colors
-    ax.plot(x_range, rewards_per_episode, color='cyan', alpha=0.3)
-    ax.plot(x_range_smoothed, smoothed, color='cyan', label="Train Reward")
-    ax.plot(test_episodes, test_rewards, 'yellow', label="Test Reward")
+    raw, = ax.plot([], [], color='cyan', alpha=0.3)
+    smoothed, = ax.plot([], [], color='cyan', label="Train Reward")
+    test, = ax.plot([], [], 'yellow', label="Test Reward")
 
     # Set labels with a larger font size
     ax.set_xlabel("Episode", color='white', fontsize=15)
@@ -73,14 +66,52 @@ for it in tqdm(model_names):
     # Set background color
     fig.set_facecolor('black')
     ax.set_facecolor('black')
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    plt.savefig(f"for_video/graphs/{it}.png", dpi=175, bbox_inches='tight')
-    plt.close()
+    return fig, ax, raw, smoothed, test
+
+def _init_worker(history):
+    global _history, _figure
+    _history = history
+    _figure = _make_figure()
+
+def render_frame(episode, path, dpi=175):
+    rewards, test_episodes, test_rewards = _history
+    fig, ax, raw, smoothed, test = _figure
+
+    prefix = rewards[:episode+1]
+    tested = test_episodes <= episode
+    raw.set_data(np.arange(len(prefix)), prefix)
+    smoothed_prefix = smooth(prefix)
+    smoothed.set_data(np.arange(len(smoothed_prefix)), smoothed_prefix)
+    test.set_data(test_episodes[tested], test_rewards[tested])
+
+    ax.relim()
+    ax.autoscale_view()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    return path
+
+def _render(job):
+    return render_frame(*job)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the learning-curve frame of every saved model.")
+    parser.add_argument("--source", type=str, default="training_state.pth", help="Final training state (.pth) or metrics log (.jsonl).")
+    parser.add_argument("--models_dir", type=str, default="for_video/saved_models", help="One frame per NNNN.pth in here.")
+    parser.add_argument("--output_dir", type=str, default="for_video/graphs", help="Where NNNN.png frames are written.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Rendering processes (0 = render inline).")
+    args = parser.parse_args()
+
+    model_names = [a[:-4] for a in os.listdir(args.models_dir) if a.endswith(".pth")]
+    model_names.sort(key=int)
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = [(int(it) - 1, os.path.join(args.output_dir, f"{it}.png")) for it in model_names]
+
+    history = load_history(args.source)
+    if args.workers == 0:
+        _init_worker(history)
+        for job in tqdm(jobs):
+            _render(job)
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(history,)) as pool:
+            chunksize = max(1, len(jobs) // (4 * args.workers))
+            for _ in tqdm(pool.map(_render, jobs, chunksize=chunksize), total=len(jobs)):
+                pass
@@ -0,0 +1,34 @@
+import argparse
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from metrics import read_metrics
+
+def plot_rewards(metrics_path, output_path, upto_episode=None, dpi=None, title=None):
+    metrics = read_metrics(metrics_path, upto_episode)
+    episodes = metrics["episodes"]
+    if not episodes:
+        return
+
+    plt.plot(episodes, metrics["rewards"], color='tab:blue', alpha=0.3)
+    plt.plot(episodes, metrics["smoothed"], color='tab:blue', label="Train Reward (running mean over 100)")
+    plt.plot(metrics["test_episodes"], metrics["test_rewards"], 'tab:orange', label="Test Reward")
+    plt.xlabel("Episode")
+    plt.ylabel("Reward")
+    plt.legend()
+    plt.title(title if title is not None else f"Episode {episodes[-1]+1}")
+    plt.grid()
+    plt.savefig(output_path, dpi=dpi)
+    plt.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plot training and test rewards from a metrics log.")
+    parser.add_argument("metrics_path", type=str, help="Path to the metrics .jsonl written during training.")
+    parser.add_argument("output_path", type=str, help="Where to save the plot.")
+    parser.add_argument("--upto_episode", type=int, default=None, help="Only plot episodes up to this one (inclusive).")
+    parser.add_argument("--dpi", type=int, default=None, help="Resolution of the saved figure.")
+    parser.add_argument("--title", type=str, default=None, help="Plot title.")
+    args = parser.parse_args()
+
+    plot_rewards(args.metrics_path, args.output_path, args.upto_episode, args.dpi, args.title)
@@ -0,0 +1,108 @@
+import cProfile, io, pstats, time
+from contextlib import nullcontext
+import numpy as np
+
+# Phase timers for the training loop: `with timer("env_step"): ...` adds the
+# block's perf_counter duration to that phase. A disabled timer hands out one
+# shared no-op context, so the instrumentation can stay in the loop. report()
+# summarises the durations recorded since the previous report and adds them
+# to the run totals.
+
+_NO_TIMING = nullcontext()
+
+class _Phase:
+    __slots__ = ("samples", "start")
+
+    def __init__(self):
+        self.samples = []
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.samples.append(time.perf_counter() - self.start)
+
+class PhaseTimer:
+    def __init__(self, enabled=True, totals=None):
+        self.enabled = enabled
+        self.phases = {}
+        self.totals = dict(totals or {})  # seconds per phase over the whole run, resumed from the checkpoint
+        self.last = {}
+
+    def __call__(self, name):
+        if not self.enabled:
+            return _NO_TIMING
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = _Phase()
+        return phase
+
+    def report(self):
+        # {phase: total seconds, count and per-call percentiles} since the previous report
+        stats = {}
+        for name, phase in self.phases.items():
+            if not phase.samples:
+                continue
+            samples = np.array(phase.samples)
+            phase.samples.clear()
+            p50, p90, p99 = (float(p) for p in np.percentile(samples, [50, 90, 99]) * 1e3)
+            total = float(samples.sum())
+            self.totals[name] = self.totals.get(name, 0.0) + total
+            stats[name] = {"total_s": total, "count": len(samples), "p50_ms": p50, "p90_ms": p90, "p99_ms": p99}
+        self.last = stats
+        return stats
+
+def format_phases(stats):
+    # "env_step 1.2s 48% | update 0.9s 36% | ...", largest first
+    grand_total = sum(s["total_s"] for s in stats.values()) or 1.0
+    ranked = sorted(stats.items(), key=lambda item: -item[1]["total_s"])
+    return " | ".join(f"{name} {s['total_s']:.1f}s {s['total_s'] / grand_total:.0%}" for name, s in ranked)
+
+# Profiles the episodes [start, end) of a run with cProfile ("cprofile") or
+# torch.profiler ("torch"). update() is called with the index of the next
+# episode whenever one finishes; the results are written when the window
+# closes: <prefix>.prof (pstats) or <prefix>.json (Chrome trace), plus a
+# text summary in <prefix>.txt.
+class ProfileWindow:
+    def __init__(self, kind, start, end, prefix):
+        assert kind in ("cprofile", "torch"), f"unknown profiler: {kind}"
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.prefix = prefix
+        self.profiler = None
+        self.done = False
+
+    def update(self, episode):
+        if self.profiler is None and not self.done and self.start <= episode < self.end:
+            self._start()
+        elif self.profiler is not None and episode >= self.end:
+            self.close()
+
+    def _start(self):
+        if self.kind == "cprofile":
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        else:
+            import torch.profiler
+            self.profiler = torch.profiler.profile(activities=[torch.profiler.ProfilerActivity.CPU], record_shapes=True)
+            self.profiler.__enter__()
+
+    def close(self):
+        if self.profiler is None:
+            return
+        if self.kind == "cprofile":
+            self.profiler.disable()
+            self.profiler.dump_stats(self.prefix + ".prof")
+            summary = io.StringIO()
+            pstats.Stats(self.profiler, stream=summary).sort_stats("cumulative").print_stats(50)
+            summary = summary.getvalue()
+        else:
+            self.profiler.__exit__(None, None, None)
+            self.profiler.export_chrome_trace(self.prefix + ".json")
+            summary = self.profiler.key_averages().table(sort_by="self_cpu_time_total", row_limit=50)
+        with open(self.prefix + ".txt", "w") as f:
+            f.write(summary)
+        self.profiler = None
+        self.done = True
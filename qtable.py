@@ -0,0 +1,91 @@
+from collections import OrderedDict
+import numpy as np
+
+# Observations are flattened binary sensor grids, so a state with k sensors is
+# one of 2^k bit patterns. For small grids the DQN is evaluated once over all
+# of them and acting becomes an array lookup; for large grids Q-values are
+# computed on demand and kept in an LRU cache keyed on the packed pattern.
+
+MAX_TABLE_BITS = 20
+
+def pack_bits(states):
+    # (N, k) binary observations -> (N,) int64 keys, sensor j is bit j
+    states = np.asarray(states)
+    bits = (states > 0.5).astype(np.int64)
+    return bits @ (np.int64(1) << np.arange(states.shape[-1], dtype=np.int64))
+
+def unpack_bits(keys, state_dim):
+    keys = np.asarray(keys, dtype=np.int64)
+    return ((keys[:, None] >> np.arange(state_dim)) & 1).astype(np.float32)
+
+class QTable:
+    def __init__(self, model, state_dim, max_table_bits=MAX_TABLE_BITS, cache_size=1 << 16, chunk_size=1 << 14):
+        self.model = model
+        self.state_dim = state_dim
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.q_values = None
+        self.cache = OrderedDict()
+        if state_dim <= max_table_bits:
+            keys = np.arange(1 << state_dim)
+            self.q_values = np.concatenate([
+                self._forward(unpack_bits(keys[i:i+chunk_size], state_dim))
+                for i in range(0, len(keys), chunk_size)
+            ])
+            self.actions = self.q_values.argmax(1)
+
+    def _forward(self, states):
+        if hasattr(self.model, "q_values"):
+            return self.model.q_values(states)  # numpy_policy.NumpyPolicy
+        import torch
+        with torch.no_grad():
+            return self.model(torch.from_numpy(states)).numpy()
+
+    def q_batch(self, states):
+        keys = pack_bits(states)
+        if self.q_values is not None:
+            self.hits += len(keys)
+            return self.q_values[keys]
+
+        # each distinct pattern is looked up and computed once; repeats within
+        # the batch count as hits
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        missing = []
+        rows = []
+        for j, key in enumerate(unique_keys.tolist()):
+            row = self.cache.get(key)
+            if row is None:
+                missing.append(j)
+            else:
+                self.cache.move_to_end(key)
+            rows.append(row)
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            computed = self._forward(np.asarray(states, dtype=np.float32)[first[missing]])
+            for j, row in zip(missing, computed):
+                rows[j] = row
+                self.cache[int(unique_keys[j])] = row
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return np.stack(rows)[inverse.reshape(-1)]
+
+    def act_batch(self, states):
+        if self.q_values is not None:
+            keys = pack_bits(states)
+            self.hits += len(keys)
+            return self.actions[keys]
+        return self.q_batch(states).argmax(1)
+
+    def act(self, state):
+        return int(self.act_batch(np.asarray(state)[None])[0])
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        mode = f"table of {len(self.q_values)} states" if self.q_values is not None else f"LRU cache ({len(self.cache)}/{self.cache_size} entries)"
+        return f"QTable: {mode}, {self.hits + self.misses} lookups, hit rate {self.hit_rate:.2%}"
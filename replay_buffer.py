@@ -0,0 +1,168 @@
+import numpy as np
+
+# Experience Replay Buffer
+# Transitions live in preallocated contiguous arrays used as a ring buffer, so
+# push() is a handful of row writes and sample() is one vectorized index draw.
+class ReplayBuffer:
+    def __init__(self, capacity, state_dim=None, state_dtype=np.float32):
+        self.capacity = capacity
+        self.state_dtype = state_dtype
+        self.pos = 0
+        self.size = 0
+        self.states = None
+        if state_dim is not None:
+            self._allocate(state_dim)
+
+    def _allocate(self, state_dim):
+        # storage is created lazily on the first push when state_dim is not given
+        self.states = np.zeros((self.capacity, state_dim), dtype=self.state_dtype)
+        self.next_states = np.zeros((self.capacity, state_dim), dtype=self.state_dtype)
+        self.actions = np.zeros(self.capacity, dtype=np.int64)
+        self.rewards = np.zeros(self.capacity, dtype=np.float32)
+        self.dones = np.zeros(self.capacity, dtype=np.float32)
+
+    def push(self, state, action, reward, next_state, done):
+        if self.states is None:
+            self._allocate(np.size(state))
+        i = self.pos
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        n = len(actions)
+        if n == 0:
+            return
+        if self.states is None:
+            self._allocate(np.shape(states)[1])
+        idx = (self.pos + np.arange(n)) % self.capacity
+        self.states[idx] = states
+        self.actions[idx] = actions
+        self.rewards[idx] = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx] = dones
+        self.pos = (self.pos + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def sample(self, batch_size, out=None):
+        idx = np.random.randint(0, self.size, size=batch_size)
+        if out is not None:
+            # gather straight into caller-owned arrays, e.g. DQNUpdater.buffers
+            for src, dst in zip((self.states, self.actions, self.rewards, self.next_states, self.dones), out):
+                np.take(src, idx, axis=0, out=dst)
+            return out
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx]
+        )
+
+    def sample_many(self, num_batches, batch_size):
+        # num_batches minibatches from one index draw, stacked along a leading axis
+        idx = np.random.randint(0, self.size, size=(num_batches, batch_size))
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx]
+        )
+
+    def __len__(self):
+        return self.size
+
+# Binary sum-tree over priorities, stored as a flat array with the root at
+# index 1 and the leaves at [tree_capacity, 2*tree_capacity). Updates and
+# prefix-sum lookups walk one root-to-leaf path, vectorized over the batch.
+class SumTree:
+    def __init__(self, capacity):
+        self.tree_capacity = 1
+        while self.tree_capacity < capacity:
+            self.tree_capacity *= 2
+        self.depth = self.tree_capacity.bit_length() - 1
+        self.tree = np.zeros(2 * self.tree_capacity, dtype=np.float64)
+
+    def total(self):
+        return self.tree[1]
+
+    def update(self, data_idx, priorities):
+        idx = np.asarray(data_idx) + self.tree_capacity
+        self.tree[idx] = priorities
+        idx = np.unique(idx // 2)
+        while idx[0] >= 1:
+            self.tree[idx] = self.tree[2 * idx] + self.tree[2 * idx + 1]
+            idx = np.unique(idx // 2)
+
+    def find(self, values):
+        # index of the leaf where the running prefix sum crosses each value
+        values = np.array(values, dtype=np.float64)
+        idx = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * idx
+            left_sum = self.tree[left]
+            go_right = values > left_sum
+            values -= np.where(go_right, left_sum, 0.0)
+            idx = left + go_right
+        return idx - self.tree_capacity
+
+    def get(self, data_idx):
+        return self.tree[np.asarray(data_idx) + self.tree_capacity]
+
+# Prioritized Experience Replay (proportional variant, Schaul et al. 2016)
+class PrioritizedReplayBuffer(ReplayBuffer):
+    def __init__(self, capacity, state_dim=None, state_dtype=np.float32, alpha=0.6, eps=1e-3):
+        super().__init__(capacity, state_dim, state_dtype)
+        self.alpha = alpha
+        self.eps = eps
+        self.tree = SumTree(capacity)
+        self.max_priority = 1.0
+
+    def push(self, state, action, reward, next_state, done):
+        i = self.pos
+        super().push(state, action, reward, next_state, done)
+        # new transitions get the highest priority so they are replayed at least once
+        self.tree.update([i], self.max_priority)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        n = len(actions)
+        if n == 0:
+            return
+        idx = (self.pos + np.arange(n)) % self.capacity
+        super().push_batch(states, actions, rewards, next_states, dones)
+        self.tree.update(idx, self.max_priority)
+
+    def sample(self, batch_size, beta=0.4):
+        # stratified sampling: one draw from each of batch_size equal slices of the total
+        segment = self.tree.total() / batch_size
+        values = (np.arange(batch_size) + np.random.random(batch_size)) * segment
+        idx = np.minimum(self.tree.find(values), self.size - 1)
+
+        probs = self.tree.get(idx) / self.tree.total()
+        weights = (self.size * probs) ** (-beta)
+        weights = (weights / weights.max()).astype(np.float32)
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx],
+            weights,
+            idx
+        )
+
+    def sample_many(self, num_batches, batch_size, beta=0.4):
+        # one stratified draw of num_batches * batch_size transitions; all
+        # minibatches see the priorities as they were before the first update
+        batch = self.sample(num_batches * batch_size, beta)
+        return tuple(a.reshape(num_batches, batch_size, *a.shape[1:]) for a in batch)
+
+    def update_priorities(self, idx, td_errors):
+        priorities = (np.abs(td_errors) + self.eps) ** self.alpha
+        self.tree.update(idx, priorities)
+        self.max_priority = max(self.max_priority, priorities.max())
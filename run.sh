@@ -3,6 +3,7 @@ set -euo pipefail
 
 rm -rf for_video
 rm *.pth
+rm -f dqn_linefollower.npz
 mkdir for_video
 mkdir for_video/saved_models
 mkdir for_video/graphs
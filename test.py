@@ -4,6 +4,9 @@ import pygame
 
 ENV_NAME = "line_follower_v0"
 enable_assist = True
+# assist from a trained policy instead of the edge sensors, e.g. "dqn_linefollower.pth";
+# the policy is compiled to a Q-table so steering stays a lookup per step
+assist_model_path = None
 
 env = gym.make(
     f'my_gym_envs/{ENV_NAME}', render_mode="human",
@@ -15,6 +18,16 @@ env = gym.make(
 )
 
 
+assist_policy = None
+if assist_model_path is not None:
+    from checkpoint import load_policy
+    from qtable import QTable
+    policy_net, loaded_model = load_policy(assist_model_path)
+    state_dim = env.observation_space.shape[0]
+    assert state_dim == loaded_model["sensor_grid"][0] * loaded_model["sensor_grid"][1], "sensor_grid does not match the model"
+    assist_policy = QTable(policy_net, state_dim)
+
+
 # Initialize pygame
 pygame.init()
 window = pygame.display.set_mode((200, 200))  # dummy window for event handling
@@ -31,7 +44,9 @@ while True:
     while not done:
         action = 1  # default: center
 
-        if enable_assist:
+        if enable_assist and assist_policy is not None:
+            action = assist_policy.act(state)
+        elif enable_assist:
             vals = state[:4]
             if vals[0]:
                 action = 0
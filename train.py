@@ -0,0 +1,435 @@
+import argparse, dataclasses, json
+import gymnasium as gym
+import numpy as np
+import torch
+import torch.optim as optim
+import random, os
+from dataclasses import dataclass
+from functools import partial
+from tqdm import tqdm
+
+from async_eval import AsyncEvaluator
+from models import DQN
+from replay_buffer import ReplayBuffer, PrioritizedReplayBuffer
+from checkpoint import CheckpointWriter, load_training_state, policy_artifact
+from dqn_update import DQNUpdater
+from metrics import MetricsLogger, RunningMean, launch_plot
+from profiling import PhaseTimer, ProfileWindow, format_phases
+import line_follower_v0
+
+# Single training entry point. Every run is described by a TrainConfig and
+# writes its checkpoint, metrics and plots into its own run_dir, so several
+# runs can share a machine:
+#   python train.py --run_dir runs/oval --track oval --sensor_grid 4 6 --threads 2
+#   python train.py --preset video
+
+@dataclass
+class TrainConfig:
+    env_name: str = "line_follower_v0"
+    episodes: int = 1000
+    gamma: float = 0.9
+    lr: float = 2e-5
+    batch_size: int = 256
+    memory_size: int = 20_000
+    eps_start: float = 1.0
+    eps_end: float = 0.05
+    eps_decay_fraction: float = 0.2  # epsilon reaches eps_end after this fraction of the episodes
+    target_update: int = 10          # update target network every N episodes
+    seed: int = 23
+    continue_training: bool = True
+
+    # environment ("oval", "hexagon", "rounded_square_orig", "square_orig", "rounded_square", "square")
+    sensor_grid: tuple = (4, 3)
+    track: str = "rounded_square_orig"
+    max_steps: int = 200
+    hitbox: int = 40
+    x_spacing: int = 40
+    y_spacing: int = 20
+
+    # network (e.g. 256x3 for a bigger model)
+    hidden_dim: int = 32
+    hidden_layers: int = 1
+
+    num_envs: int = 1                # environments stepped in lockstep
+    async_envs: bool = False         # run the environments in subprocesses (AsyncVectorEnv)
+    prioritized_replay: bool = False # sample transitions proportionally to their TD error
+    per_alpha: float = 0.6
+    per_beta_start: float = 0.4      # importance-sampling correction, annealed to 1 over training
+    warmup_size: int = None          # transitions before the first gradient step (default memory_size // 2)
+    train_every: int = 1             # env steps between training rounds
+    grad_steps: int = 1              # gradient steps per training round
+    fused_sample: bool = False       # draw all minibatches of a training round in one vectorized sample
+    compile_update: bool = False     # torch.compile the gradient step (see bench_update.py)
+    eval_episodes: int = 10
+    eval_workers: int = 2            # processes running evaluations concurrently (0 = inline)
+    eval_tolerance: float = None     # stop an evaluation once its 95% CI half-width is this small (eval_episodes is then the maximum)
+    eval_batch: int = 20             # episodes between those checks
+
+    run_dir: str = "."
+    model_file: str = "dqn_linefollower.pth"       # policy only: weights and network/env parameters
+    state_file: str = "training_state.pth"         # everything needed to resume training
+    plot_file: str = "rewards_plot.png"
+    metrics_file: str = "metrics.jsonl"
+    save_history: bool = False       # also keep for_video/saved_models/NNNN.pth/.npz (policy) and for_video/graphs/NNNN.png
+    threads: int = None              # torch intra-op threads for this process (default: torch's choice)
+    phase_timing: bool = False       # time the loop's phases, reported every target_update episodes
+    profile: str = None              # "cprofile" or "torch": profile the episodes in profile_window
+    profile_window: tuple = (10, 20) # [first, last) episode profiled, written to profile.{prof,json,txt}
+
+PRESETS = {
+    "main": TrainConfig(),
+    # the run recorded for the video
+    "video": TrainConfig(
+        episodes=800,
+        eps_start=2.5,
+        warmup_size=50*200,
+        eval_episodes=100,
+        eval_tolerance=5.0,
+        eval_workers=4,
+        save_history=True,
+    ),
+}
+
+def make_env(env_name, **env_kwargs):
+    # module-level so AsyncVectorEnv workers can build it under any start
+    # method; spawned workers have to register the env themselves
+    import line_follower_v0
+    return gym.make(f'my_gym_envs/{env_name}', render_mode=None, **env_kwargs)
+
+def make_env_kwargs(c):
+    return dict(
+        sensor_grid=tuple(c.sensor_grid),
+        track=c.track,
+        max_steps=c.max_steps,
+        hitbox=c.hitbox,
+        x_spacing=c.x_spacing,
+        y_spacing=c.y_spacing,
+    )
+
+def set_threads(threads):
+    # keep concurrent runs on one machine from oversubscribing the cores
+    if threads is not None:
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(threads)
+        except RuntimeError:
+            pass  # already fixed once any inter-op work has run
+
+def train(config):
+    c = config
+    run_path = partial(os.path.join, c.run_dir)
+    os.makedirs(c.run_dir, exist_ok=True)
+    MODEL_PATH = run_path(c.model_file)
+    MODEL_NPZ_PATH = os.path.splitext(MODEL_PATH)[0] + ".npz"
+    STATE_PATH = run_path(c.state_file)
+    PLOT_PATH = run_path(c.plot_file)
+    METRICS_PATH = run_path(c.metrics_file)
+    HISTORY_DIR = run_path("for_video")
+    if c.save_history:
+        os.makedirs(os.path.join(HISTORY_DIR, "saved_models"), exist_ok=True)
+        os.makedirs(os.path.join(HISTORY_DIR, "graphs"), exist_ok=True)
+    with open(run_path("config.json"), "w") as f:
+        json.dump(dataclasses.asdict(c), f, indent=2)
+
+    WARMUP_SIZE = c.warmup_size if c.warmup_size is not None else c.memory_size // 2
+    EPS_DECAY = (c.eps_end / c.eps_start) ** (1/(c.eps_decay_fraction*c.episodes))
+
+    set_threads(c.threads)
+
+    # set the seed for both torch and numpy and everything
+    torch.manual_seed(c.seed)
+    np.random.seed(c.seed)
+    random.seed(c.seed)
+
+    sensor_grid = tuple(c.sensor_grid)
+    device = torch.device("cpu")
+
+    # Environment setup
+    env_kwargs = make_env_kwargs(c)
+    env_fn = partial(make_env, c.env_name, **env_kwargs)
+    VectorEnv = gym.vector.AsyncVectorEnv if c.async_envs else gym.vector.SyncVectorEnv
+    envs = VectorEnv([env_fn] * c.num_envs)
+
+    state_dim = envs.single_observation_space.shape[0]
+    action_dim = envs.single_action_space.n              # 3 actions
+
+    policy_net = DQN(state_dim, action_dim, c.hidden_dim, c.hidden_layers).to(device)
+    target_net = DQN(state_dim, action_dim, c.hidden_dim, c.hidden_layers).to(device)
+    target_net.load_state_dict(policy_net.state_dict())
+    optimizer = optim.Adam(policy_net.parameters(), lr=c.lr)
+
+    start_episode = 0
+    stale_reward = None
+    rewards_per_episode = []
+    test_rewards = []
+    test_episodes = []
+    test_env_steps = []  # env steps taken when each test reward was measured
+    env_steps = 0
+    loaded_model = load_training_state(STATE_PATH, MODEL_PATH) if c.continue_training else None
+    resume = loaded_model is not None
+
+    if resume:
+        print("Continuing training from saved model.")
+        policy_net.load_state_dict(loaded_model["state_dict"])
+        target_net.load_state_dict(loaded_model["state_dict"])
+        optimizer.load_state_dict(loaded_model["optimizer_state_dict"])
+        start_episode = loaded_model["episode"] + 1
+        stale_reward = loaded_model["reward"]
+        rewards_per_episode = loaded_model["rewards_per_episode"]
+        test_rewards = loaded_model["test_rewards"]
+        test_episodes = loaded_model["test_episodes"]
+        test_env_steps = loaded_model.get("test_env_steps", [])
+        env_steps = loaded_model.get("env_steps", 0)
+    timer = PhaseTimer(c.phase_timing, totals=loaded_model.get("phase_totals") if resume else None)
+    profile_window = ProfileWindow(c.profile, *c.profile_window, run_path("profile")) if c.profile else None
+
+    epsilon = max(c.eps_start * EPS_DECAY ** start_episode, c.eps_end)
+    target_net.eval()
+
+    if c.prioritized_replay:
+        memory = PrioritizedReplayBuffer(c.memory_size, state_dim, alpha=c.per_alpha)
+    else:
+        memory = ReplayBuffer(c.memory_size, state_dim)
+
+    updater = DQNUpdater(policy_net, target_net, optimizer, c.gamma, c.batch_size, state_dim, compile=c.compile_update, device=device)
+
+    def checkpoint_content(episode):
+        return {
+            "state_dict": policy_net.state_dict(),
+            "hidden_dim": c.hidden_dim,
+            "hidden_layers": c.hidden_layers,
+            "optimizer_state_dict": optimizer.state_dict(),
+            "episode": episode,
+            "env_steps": env_steps,
+            "epsilon": epsilon,
+            "rewards_per_episode": rewards_per_episode,
+            "reward": np.mean(rewards_per_episode[-10:]) if len(rewards_per_episode) >= 10 else None,
+            "test_rewards": test_rewards,
+            "test_episodes": test_episodes,
+            "test_env_steps": test_env_steps,
+            "sensor_grid": sensor_grid,
+            "action_dim": action_dim,
+            "track": c.track,
+            "max_steps": c.max_steps,
+            "hitbox": c.hitbox,
+            "x_spacing": c.x_spacing,
+            "y_spacing": c.y_spacing,
+            "phase_totals": timer.totals,
+            "phase_stats": timer.last,
+        }
+
+    def merge_test_results(results):
+        for (test_episode, test_steps), result in results:
+            if c.eval_tolerance is not None:
+                test_reward_mean, half_width, episodes_used = result
+                stopping = dict(ci=float(half_width), episodes=episodes_used)
+            else:
+                test_reward_mean, stopping = result, {}
+            test_rewards.append(test_reward_mean)
+            test_episodes.append(test_episode)
+            test_env_steps.append(test_steps)
+            metrics_logger.log("test", episode=test_episode, reward=float(test_reward_mean), env_steps=test_steps, **stopping)
+
+    checkpoint_writer = CheckpointWriter()
+    evaluator = AsyncEvaluator(
+        (state_dim, action_dim, c.hidden_dim, c.hidden_layers),
+        c.env_name,
+        env_kwargs,
+        episodes=c.eval_episodes,
+        max_workers=c.eval_workers,
+        tolerance=c.eval_tolerance,
+        batch_episodes=c.eval_batch
+    )
+    metrics_logger = MetricsLogger(METRICS_PATH, append=resume)
+    smoothed_reward = RunningMean(100)
+    for total_reward in rewards_per_episode[-100:]:
+        smoothed_reward.update(total_reward)
+    plot_process = None
+    graph_processes = []
+
+    # Training Loop
+    progress_bar = tqdm(
+        total=c.episodes,
+        initial=start_episode,
+        desc=f"Avg Reward (last 10): {stale_reward}, Epsilon: {epsilon:.2f}",
+        dynamic_ncols=True
+    )
+    states, _ = envs.reset(seed=c.seed)
+    episode_rewards = np.zeros(c.num_envs)
+    # with gymnasium's next-step autoreset, an env that finished on the previous
+    # step is reset by the current one and its output is not a real transition
+    autoreset = np.zeros(c.num_envs, dtype=bool)
+    steps_since_train = 0
+    loss_sum, loss_count = 0.0, 0
+    episode = start_episode
+    if profile_window is not None:
+        profile_window.update(episode)
+    while episode < c.episodes:
+        # Epsilon-greedy actions, one batched forward over all envs
+        with timer("act"):
+            explore = np.random.random(c.num_envs) < epsilon
+            actions = np.random.randint(action_dim, size=c.num_envs)
+            if not explore.all():
+                with torch.no_grad():
+                    state_tensor = torch.as_tensor(states, dtype=torch.float32, device=device)
+                    greedy = policy_net(state_tensor).argmax(1).cpu().numpy()
+                actions = np.where(explore, actions, greedy)
+
+        with timer("env_step"):
+            next_states, rewards, terminated, truncated, _ = envs.step(actions)
+        dones = terminated | truncated
+
+        valid = ~autoreset
+        with timer("replay_push"):
+            memory.push_batch(states[valid], actions[valid], rewards[valid], next_states[valid], dones[valid])
+        episode_rewards[valid] += rewards[valid]
+        env_steps += int(valid.sum())
+        states = next_states
+        autoreset = dones
+
+        # Train every train_every env steps, grad_steps gradient steps each
+        if len(memory) < WARMUP_SIZE:
+            steps_since_train = 0
+        else:
+            steps_since_train += int(valid.sum())
+        n_updates = (steps_since_train // c.train_every) * c.grad_steps
+        if n_updates:
+            steps_since_train %= c.train_every
+            sample_args = ()
+            if c.prioritized_replay:
+                sample_args = (c.per_beta_start + (1.0 - c.per_beta_start) * min(1.0, episode / c.episodes),)
+
+            if c.fused_sample:
+                with timer("sample"):
+                    batches = memory.sample_many(n_updates, c.batch_size, *sample_args)
+                for g in range(n_updates):
+                    with timer("update"):
+                        updater.load([a[g] for a in batches])
+                        loss, td_errors = updater.step(return_td_errors=c.prioritized_replay)
+                        loss_sum, loss_count = loss_sum + loss, loss_count + 1
+                        if c.prioritized_replay:
+                            memory.update_priorities(batches[-1][g], td_errors)
+            else:
+                for _ in range(n_updates):
+                    with timer("sample"):
+                        if c.prioritized_replay:
+                            batch = memory.sample(c.batch_size, *sample_args)
+                            updater.load(batch)
+                        else:
+                            memory.sample(c.batch_size, out=updater.buffers)
+                    with timer("update"):
+                        loss, td_errors = updater.step(return_td_errors=c.prioritized_replay)
+                        loss_sum, loss_count = loss_sum + loss, loss_count + 1
+                        if c.prioritized_replay:
+                            memory.update_priorities(batch[-1], td_errors)
+
+        for i in np.flatnonzero(dones):
+            if episode >= c.episodes:
+                break
+            total_reward = float(episode_rewards[i])
+            episode_rewards[i] = 0
+            rewards_per_episode.append(total_reward)
+            # mean loss of the gradient steps taken since the previous episode ended
+            mean_loss = float(loss_sum / loss_count) if loss_count else None
+            loss_sum, loss_count = 0.0, 0
+            metrics_logger.log(
+                "episode",
+                episode=episode,
+                reward=total_reward,
+                smoothed=smoothed_reward.update(total_reward),
+                epsilon=epsilon,
+                loss=mean_loss,
+                env_steps=env_steps,
+            )
+
+            with timer("evaluate"):
+                merge_test_results(evaluator.collect())
+
+            if (episode+1) % c.target_update == 0:
+                # update target_network
+                target_net.load_state_dict(policy_net.state_dict())
+
+                # evaluate a frozen copy of the current model in the background
+                with timer("evaluate"):
+                    evaluator.submit((episode, env_steps), policy_net)
+
+                # redraw the plot in a separate process, skipping if the previous one is still busy
+                title = f"({c.env_name}) Episode {episode+1}"
+                with timer("plot"):
+                    if plot_process is None or plot_process.poll() is not None:
+                        plot_process = launch_plot(METRICS_PATH, PLOT_PATH, upto_episode=episode, title=title)
+
+                # save training state and policy (written atomically on a background
+                # thread), plus the history copy of the policy once training has started
+                policy_paths = [MODEL_PATH, MODEL_NPZ_PATH]
+                started_training = len(memory) >= WARMUP_SIZE
+                if c.save_history and started_training:
+                    history_path = os.path.join(HISTORY_DIR, "saved_models", f"{episode+1:04d}")
+                    policy_paths += [history_path + ".pth", history_path + ".npz"]
+                    with timer("plot"):
+                        graph_processes = [p for p in graph_processes if p.poll() is None]
+                        graph_path = os.path.join(HISTORY_DIR, "graphs", f"{episode+1:04d}.png")
+                        graph_processes.append(launch_plot(METRICS_PATH, graph_path, upto_episode=episode, dpi=150, title=title))
+
+                # phase times since the previous target update (checkpointing shows up in the next window)
+                if timer.enabled:
+                    phase_stats = timer.report()
+                    metrics_logger.log("timing", episode=episode, phases=phase_stats)
+                    progress_bar.set_postfix_str(format_phases(phase_stats))
+
+                with timer("checkpoint"):
+                    checkpoint = checkpoint_content(episode)
+                    checkpoint_writer.save(checkpoint, STATE_PATH)
+                    checkpoint_writer.save(policy_artifact(checkpoint), *policy_paths)
+
+            # Update tqdm description every 10 episodes
+            if (episode) % 10 == 0:
+                avg_reward = np.mean(rewards_per_episode[-10:])
+                progress_bar.set_description(f"Avg Reward (last 10): {avg_reward:.2f}, Epsilon: {epsilon:.2f}")
+
+            # Decay epsilon
+            epsilon = max(c.eps_end, epsilon * EPS_DECAY)
+            progress_bar.update(1)
+            episode += 1
+            if profile_window is not None:
+                profile_window.update(episode)
+
+    envs.close()
+    if profile_window is not None:
+        profile_window.close()
+
+    # wait for outstanding evaluations and save their results with the final checkpoint
+    merge_test_results(evaluator.close())
+    checkpoint = checkpoint_content(episode - 1)
+    checkpoint_writer.save(checkpoint, STATE_PATH)
+    checkpoint_writer.save(policy_artifact(checkpoint), MODEL_PATH, MODEL_NPZ_PATH)
+    checkpoint_writer.close()
+    metrics_logger.close()
+    for p in graph_processes + [plot_process]:
+        if p is not None:
+            p.wait()
+    launch_plot(METRICS_PATH, PLOT_PATH, title=f"({c.env_name}) Episode {episode}").wait()
+    progress_bar.close()
+
+def parse_config(argv=None, preset="main", presets=PRESETS):
+    # flags for every field of the presets' config class (TrainConfig or a subclass)
+    parser = argparse.ArgumentParser(description="Train a DQN on the line follower environment.")
+    parser.add_argument("--preset", type=str, default=preset, choices=sorted(presets), help="Base configuration to start from.")
+    for field in dataclasses.fields(presets[preset]):
+        flag = f"--{field.name}"
+        if field.type is bool:
+            parser.add_argument(flag, action=argparse.BooleanOptionalAction, default=None)
+        elif field.type is tuple:
+            parser.add_argument(flag, type=int, nargs="+", default=None)
+        else:
+            parser.add_argument(flag, type=field.type, default=None)
+    args = vars(parser.parse_args(argv))
+    base = presets[args.pop("preset")]
+    overrides = {k: (tuple(v) if isinstance(v, list) else v) for k, v in args.items() if v is not None}
+    return dataclasses.replace(base, **overrides)
+
+def main(argv=None, preset="main"):
+    train(parse_config(argv, preset))
+
+if __name__ == "__main__":
+    main()
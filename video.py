@@ -1,10 +1,61 @@
 import gymnasium as gym
-import torch
-import torch.nn as nn
-from models import DQN
 import numpy as np
 import os
 import argparse
+from frames import frame_writer
+from numpy_policy import greedy_actions
+
+# Record-and-replay: with record=True an episode is played headless, keeping
+# only its reset seed and actions. Episodes that pass save_threshold are
+# stored as a trajectory (.traj.npz next to the run file) and replayed in
+# rgb_array mode to render their frames, so discarded episodes are never
+# rendered and kept ones can be rendered again later without the policy.
+
+def trajectory_path(output_path):
+    return os.path.splitext(output_path)[0] + ".traj.npz"
+
+def save_trajectory(path, env_name, env_kwargs, seed, actions, total_reward):
+    np.savez(
+        path,
+        env_name=env_name,
+        seed=seed,
+        actions=np.asarray(actions, dtype=np.uint8),
+        total_reward=total_reward,
+        # unset options (None) are left out and fall back to the env's defaults on replay
+        **{k: np.asarray(v) for k, v in env_kwargs.items() if v is not None}
+    )
+
+def load_trajectory(path):
+    with np.load(path) as data:
+        trajectory = {k: data[k] if data[k].ndim else data[k].item() for k in data.files}
+    trajectory["sensor_grid"] = tuple(trajectory["sensor_grid"].tolist())
+    return trajectory
+
+def render_trajectory(trajectory, output_path, scale=1, verbose=False):
+    # replays the recorded actions from the recorded seed and writes the frames
+    env_kwargs = {k: v for k, v in trajectory.items() if k not in ("env_name", "seed", "actions", "total_reward")}
+    env = gym.make(f'my_gym_envs/{trajectory["env_name"]}', render_mode="rgb_array", **env_kwargs)
+    frames = frame_writer(output_path, capacity=len(trajectory["actions"]) + 1)
+
+    def render():
+        frame = env.render()
+        if scale != 1:
+            frame = np.repeat(np.repeat(frame, scale, axis=0), scale, axis=1)
+        frames.append(frame)
+
+    env.reset(seed=trajectory["seed"])
+    render()
+    total_reward = 0
+    for action in trajectory["actions"]:
+        _, reward, terminated, truncated, _ = env.step(int(action))
+        total_reward += reward
+        render()
+    env.close()
+    frames.close()
+    if not np.isclose(total_reward, trajectory["total_reward"]):
+        print(f"Warning: replay scored {total_reward}, recorded {trajectory['total_reward']}; the env is not deterministic given seed and actions")
+    if verbose:
+        print(f"Rendered {frames.count} frames to {output_path}")
 
 def evaluate_model(
     model, env_name,
@@ -19,13 +70,15 @@ def evaluate_model(
     output_path=None,
     save_threshold=None,
     invert_waypoints=None,
-    invert_colours=None
+    invert_colours=None,
+    record=False,
+    seed=None
 ):
-    # If an output path is provided, we must use 'rgb_array' to collect frames
-    render_mode = "rgb_array" if output_path else "human"
-    
-    env = gym.make(
-        f'my_gym_envs/{env_name}', render_mode=render_mode,
+    # If an output path is provided, we must use 'rgb_array' to collect frames,
+    # unless the episodes are recorded headless and replayed
+    record = record and output_path is not None
+    render_mode = None if record else ("rgb_array" if output_path else "human")
+    env_kwargs = dict(
         sensor_grid=sensor_grid,
         track=track,
         max_steps=max_steps,
@@ -35,81 +88,201 @@ def evaluate_model(
         invert_waypoints=invert_waypoints,
         invert_colours=invert_colours
     )
+    env = gym.make(f'my_gym_envs/{env_name}', render_mode=render_mode, **env_kwargs)
+    seeds = np.random.default_rng(seed)
     
     total_rewards = []
     for ep in range(episodes):
-        state, _ = env.reset()
+        episode_seed = int(seeds.integers(2**31)) if record else None
+        state, _ = env.reset(seed=episode_seed)
         done = False
         total_reward = 0
-        frames = []
+        frames = None
+        actions = []
 
-        if output_path:
+        if output_path and not record:
+            # reset frame plus at most max_steps steps
+            frames = frame_writer(output_path, capacity=max_steps + 1)
             frames.append(env.render())
 
         while not done:
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                q_values = model(state_tensor)
-                action = q_values.argmax().item()
+            action = int(greedy_actions(model, np.asarray(state)[None])[0])
 
             next_state, reward, terminated, truncated, _ = env.step(action)
             state = next_state
             total_reward += reward
             done = terminated or truncated
 
-            if output_path:
+            if record:
+                actions.append(action)
+            elif output_path:
                 frames.append(env.render())
 
         total_rewards.append(total_reward)
         if verbose: print(f"Episode {ep+1}: Total Reward = {total_reward}")
 
-        if output_path and save_threshold is not None:
-            if total_reward >= save_threshold:
-                run_data = np.array(frames)
-                np.save(output_path, run_data)
+        if output_path:
+            if save_threshold is not None and total_reward >= save_threshold:
+                if record:
+                    save_trajectory(trajectory_path(output_path), env_name, env_kwargs, episode_seed, actions, total_reward)
+                    render_trajectory(load_trajectory(trajectory_path(output_path)), output_path)
+                else:
+                    frames.close()
                 if verbose:
-                    print(f"Score >= {save_threshold}. Saved run data to {output_path} with shape {run_data.shape}")
+                    print(f"Score >= {save_threshold}. Saved run data to {output_path}")
             else:
+                if not record:
+                    frames.discard()
                 if verbose:
                     print(f"Score < {save_threshold}. Discarding run data.")
 
     env.close()
     return np.mean(total_rewards)
 
+def evaluate_variants(
+    model, env_name,
+    sensor_grid,
+    track,
+    max_steps,
+    hitbox,
+    x_spacing,
+    y_spacing,
+    variants,
+    output_paths,
+    verbose=False,
+    save_threshold=None,
+    record=False,
+    seed=None
+):
+    # One episode per (invert_waypoints, invert_colours) variant, all in this
+    # process: one env per variant, stepped in lockstep with a single batched
+    # forward over the variants still running. Variant j is written to
+    # output_paths[j] under the same rules as evaluate_model.
+    render_mode = None if record else "rgb_array"
+    env_kwargs = [
+        dict(
+            sensor_grid=sensor_grid,
+            track=track,
+            max_steps=max_steps,
+            hitbox=hitbox,
+            x_spacing=x_spacing,
+            y_spacing=y_spacing,
+            invert_waypoints=invert_waypoints,
+            invert_colours=invert_colours
+        )
+        for invert_waypoints, invert_colours in variants
+    ]
+    envs = [gym.make(f'my_gym_envs/{env_name}', render_mode=render_mode, **kwargs) for kwargs in env_kwargs]
+    seeds = np.random.default_rng(seed)
+    episode_seeds = [int(seeds.integers(2**31)) if record else None for _ in envs]
+
+    states = np.stack([env.reset(seed=s)[0] for env, s in zip(envs, episode_seeds)]).astype(np.float32)
+    frames = []
+    if not record:
+        for env, path in zip(envs, output_paths):
+            frames.append(frame_writer(path, capacity=max_steps + 1))
+            frames[-1].append(env.render())
+    actions_taken = [[] for _ in envs]
+    total_rewards = np.zeros(len(envs))
+    active = np.ones(len(envs), dtype=bool)
+    while active.any():
+        idx = np.flatnonzero(active)
+        actions = greedy_actions(model, states[idx])
+
+        for i, action in zip(idx, actions):
+            next_state, reward, terminated, truncated, _ = envs[i].step(int(action))
+            states[i] = next_state
+            total_rewards[i] += reward
+            if record:
+                actions_taken[i].append(int(action))
+            else:
+                frames[i].append(envs[i].render())
+            if terminated or truncated:
+                active[i] = False
+    for env in envs:
+        env.close()
+
+    for i, path in enumerate(output_paths):
+        if verbose: print(f"Variant {i+1} {variants[i]}: Total Reward = {total_rewards[i]}")
+        if save_threshold is not None and total_rewards[i] >= save_threshold:
+            if record:
+                save_trajectory(trajectory_path(path), env_name, env_kwargs[i], episode_seeds[i], actions_taken[i], total_rewards[i])
+                render_trajectory(load_trajectory(trajectory_path(path)), path)
+            else:
+                frames[i].close()
+            if verbose:
+                print(f"Score >= {save_threshold}. Saved run data to {path}")
+        else:
+            if not record:
+                frames[i].discard()
+            if verbose:
+                print(f"Score < {save_threshold}. Discarding run data.")
+    return total_rewards
+
 if __name__ == "__main__":
     import line_follower_v0
+    from numpy_policy import load_numpy_policy
 
     parser = argparse.ArgumentParser(description="Evaluate a DQN model for the line follower environment.")
-    parser.add_argument("--model_path", type=str, default="dqn_linefollower.pth", help="Path to the trained model file.")
+    parser.add_argument("--model_path", type=str, default="dqn_linefollower.pth", help="Path to the trained policy (.pth or .npz).")
     parser.add_argument("--save_dir", type=str, default="run_data", help="Directory to save the run data.")
     parser.add_argument("--filename", type=str, default="run_1.npy", help="Filename for the saved run data.")
     parser.add_argument("--save_threshold", type=float, default=0.0, help="Minimum reward threshold to save the episode data.")
     parser.add_argument("--invert_waypoints", action="store_true", help="Invert waypoints during evaluation.")
     parser.add_argument("--invert_colours", action="store_true", help="Invert track colors during evaluation.")
+    parser.add_argument("--compact", action="store_true", help="Save the run in the compact palette/delta format (.lfr, read with frames.read_frames) instead of .npy.")
+    parser.add_argument("--variants", type=str, nargs="+", default=None, help="Run several variants from one process, e.g. --variants 11 00 10 (invert_waypoints, invert_colours bits), written to run_1, run_2, ... in save_dir.")
+    parser.add_argument("--record", action="store_true", help="Play headless and render only a kept episode, by replaying its recorded seed and actions.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the recorded episodes (with --record).")
+    parser.add_argument("--replay", type=str, default=None, help="Render a saved .traj.npz instead of running the model.")
+    parser.add_argument("--scale", type=int, default=1, help="Integer upscaling of the frames rendered with --replay.")
+    parser.add_argument("--q_table", action="store_true", help="Act from a precomputed Q-table instead of a forward per step.")
     
     args = parser.parse_args()
     # print(f"{args.invert_waypoints=}, {args.invert_colours=}")
 
     os.makedirs(args.save_dir, exist_ok=True)
+    output_filename = os.path.join(args.save_dir, args.filename)
+    if args.compact:
+        output_filename = os.path.splitext(output_filename)[0] + ".lfr"
+    if args.replay is not None:
+        render_trajectory(load_trajectory(args.replay), output_filename, scale=args.scale, verbose=True)
+        raise SystemExit
+
     assert os.path.exists(args.model_path), f"Model file not found: {args.model_path}"
     
-    loaded_model = torch.load(args.model_path, map_location=torch.device('cpu'), weights_only=False)
+    policy_net, loaded_model = load_numpy_policy(args.model_path)
     sensor_grid = loaded_model["sensor_grid"]
     hitbox = loaded_model["hitbox"]
     track = loaded_model["track"]
+    policy = policy_net
+    if args.q_table:
+        from qtable import QTable
+        policy = QTable(policy_net, sensor_grid[0] * sensor_grid[1])
 
-    policy_net = DQN(
-        sensor_grid[0] * sensor_grid[1],
-        loaded_model["action_dim"],
-        loaded_model["hidden_dim"],
-        loaded_model["hidden_layers"]
-    )
-    policy_net.load_state_dict(loaded_model["state_dict"])
-    policy_net.eval()
+    if args.variants is not None:
+        variants = [(bits[0] == "1", bits[1] == "1") for bits in args.variants]
+        ext = os.path.splitext(output_filename)[1]
+        evaluate_variants(
+            policy,
+            "line_follower_v0",
+            sensor_grid,
+            track,
+            max_steps=loaded_model["max_steps"],
+            hitbox=hitbox,
+            x_spacing=loaded_model["x_spacing"],
+            y_spacing=loaded_model["y_spacing"],
+            variants=variants,
+            output_paths=[os.path.join(args.save_dir, f"run_{j+1}{ext}") for j in range(len(variants))],
+            verbose=True,
+            save_threshold=args.save_threshold,
+            record=args.record,
+            seed=args.seed
+        )
+        raise SystemExit
 
-    output_filename = os.path.join(args.save_dir, args.filename)
     avg_reward = evaluate_model(
-        policy_net,
+        policy,
         "line_follower_v0",
         sensor_grid,
         track,
@@ -122,5 +295,9 @@ if __name__ == "__main__":
         output_path=output_filename,
         save_threshold=args.save_threshold,
         invert_waypoints=args.invert_waypoints,
-        invert_colours=args.invert_colours
+        invert_colours=args.invert_colours,
+        record=args.record,
+        seed=args.seed
     )
+    if args.q_table:
+        print(policy.stats())